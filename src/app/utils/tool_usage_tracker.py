@@ -8,19 +8,27 @@ Track tool usage, success rate, execution time and other metrics to help Agent s
 
 import json
 import time
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Iterable, Optional, Tuple
 from collections import defaultdict
 
 
 class ToolUsageTracker:
     """Tool usage tracker"""
     
-    def __init__(self, stats_file: str = "output/logs/tool_usage_stats.json"):
+    def __init__(self, stats_file: str = "output/logs/tool_usage_stats.json",
+                 autoflush: bool = True):
         self.stats_file = Path(stats_file)
         self.stats_file.parent.mkdir(parents=True, exist_ok=True)
         
+        # Periodic saves are deferred (and flush() must be called) when
+        # autoflush is off or while inside batch()
+        self.autoflush = autoflush
+        self._batch_depth = 0
+        self._dirty = False
+        
         # Current session statistics (in-memory)
         self.session_stats = defaultdict(lambda: {
             "total_calls": 0,
@@ -37,15 +45,17 @@ class ToolUsageTracker:
     
     def load_stats(self):
         """Load historical statistics data"""
-        if self.stats_file.exists():
-            try:
-                with open(self.stats_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    # Merge historical data into current session
-                    for tool_name, stats in data.get("tools", {}).items():
-                        self.session_stats[tool_name].update(stats)
-            except Exception as e:
-                print(f"Warning: Failed to load tool stats: {e}")
+        try:
+            with open(self.stats_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            # Merge historical data into current session
+            for tool_name, stats in data.get("tools", {}).items():
+                self.session_stats[tool_name].update(stats)
+        except FileNotFoundError:
+            # No history yet
+            pass
+        except Exception as e:
+            print(f"Warning: Failed to load tool stats: {e}")
     
     def save_stats(self):
         """Save statistics data to file"""
@@ -57,9 +67,33 @@ class ToolUsageTracker:
             
             with open(self.stats_file, 'w', encoding='utf-8') as f:
                 json.dump(stats_data, f, indent=2, ensure_ascii=False)
+            self._dirty = False
         except Exception as e:
             print(f"Warning: Failed to save tool stats: {e}")
     
+    def flush(self):
+        """Save statistics if a periodic save was deferred"""
+        if self._dirty:
+            self.save_stats()
+    
+    @contextmanager
+    def batch(self):
+        """
+        Defer periodic saves for a burst of calls and save at most once at the end
+        
+        Usage:
+            with tracker.batch():
+                tracker.track_call(...)
+                tracker.track_call(...)
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self.autoflush:
+                self.flush()
+    
     def track_call(self, tool_name: str, success: bool, execution_time: float, 
                     error_msg: Optional[str] = None):
         """
@@ -92,7 +126,21 @@ class ToolUsageTracker:
         
         # Periodically save (save every 5 calls)
         if stats["total_calls"] % 5 == 0:
-            self.save_stats()
+            if self.autoflush and self._batch_depth == 0:
+                self.save_stats()
+            else:
+                self._dirty = True
+    
+    def track_calls(self, calls: Iterable[Tuple[str, bool, float, Optional[str]]]):
+        """
+        Track several tool calls, saving at most once at the end
+        
+        Args:
+            calls: (tool_name, success, execution_time, error_msg) tuples
+        """
+        with self.batch():
+            for tool_name, success, execution_time, error_msg in calls:
+                self.track_call(tool_name, success, execution_time, error_msg)
     
     def get_tool_stats(self, tool_name: str) -> Dict[str, Any]:
         """Get statistics for specific tool"""
@@ -224,6 +272,9 @@ class ToolUsageTracker:
 # Global tracker instance
 _tracker_instance = None
 
+# Clock used to time decorated tool calls (replaceable in tests)
+_now = time.perf_counter
+
 def get_tracker() -> ToolUsageTracker:
     """Get global tracker instance"""
     global _tracker_instance
@@ -244,7 +295,7 @@ def track_tool_execution(tool_name: str):
     def decorator(func):
         def wrapper(*args, **kwargs):
             tracker = get_tracker()
-            start_time = time.time()
+            start_time = _now()
             success = False
             error_msg = None
             
@@ -256,7 +307,7 @@ def track_tool_execution(tool_name: str):
                 error_msg = str(e)
                 raise
             finally:
-                execution_time = time.time() - start_time
+                execution_time = _now() - start_time
                 tracker.track_call(tool_name, success, execution_time, error_msg)
         
         return wrapper
@@ -201,20 +201,10 @@ def list_il_files(directory: str = "output") -> str:
     except Exception as e:
         return f"❌ Error occurred while listing il files: {e}" 
 
-@tool
-def run_il_with_screenshot(il_file_path: str, lib: str, cell: str, screenshot_path: Optional[str] = None, view: str = "layout") -> str:
-    """
-    Run il file using skillbridge library and save screenshot
-    
-    Args:
-        il_file_path: Path to il file (can be relative or absolute path)
-        lib: target library name (required)
-        cell: target cell name (required)
-        screenshot_path: Optional absolute/relative path to save the screenshot. If None, will save to output/screenshots/virtuoso_<stem>_<timestamp>.png
-        view: target view name (default: "layout")
-        
-    Returns:
-        JSON format string containing execution status, screenshot path and observation information
+def run_il_with_screenshot_obj(il_file_path: str, lib: str, cell: str, screenshot_path: Optional[str] = None, view: str = "layout", collect_observations: bool = True) -> Dict[str, Any]:
+    """Run il file and save screenshot, returning the result as a dict (see run_il_with_screenshot)
+
+    collect_observations=False leaves "observations" empty for callers that never show it.
     """
     result_dict = {
         "status": "error",
@@ -222,18 +212,19 @@ def run_il_with_screenshot(il_file_path: str, lib: str, cell: str, screenshot_pa
         "screenshot_path": None,
         "observations": []
     }
+    observe = result_dict["observations"].append if collect_observations else (lambda message: None)
     
     try:
         # Open specified cellView and set as current edit view first
         ok = open_cell_view_by_type(lib, cell, view=view, view_type=None, mode="w", timeout=30)
         if not ok:
             result_dict["message"] = f"❌ Error: Failed to open cellView {lib}/{cell}/{view}"
-            return json.dumps(result_dict, ensure_ascii=False)
+            return result_dict
         # Open window to display the cellView
         window_ok = ge_open_window(lib, cell, view=view, view_type=None, mode="a", timeout=30)
         if not window_ok:
             result_dict["message"] = f"❌ Error: Failed to open window for {lib}/{cell}/{view}"
-            return json.dumps(result_dict, ensure_ascii=False)
+            return result_dict
         ui_redraw(timeout=10)
         sleep(0.5)
         # Set cv variable for IL file to use
@@ -249,12 +240,12 @@ def run_il_with_screenshot(il_file_path: str, lib: str, cell: str, screenshot_pa
                 skill_path = output_path
             else:
                 result_dict["message"] = f"❌ Error: File {il_file_path} does not exist, also not found in output directory: {skill_path.name}"
-                return json.dumps(result_dict, ensure_ascii=False)
+                return result_dict
         
         # Check file extension
         if skill_path.suffix.lower() not in ['.il', '.skill']:
             result_dict["message"] = f"❌ Error: File {skill_path} is not a valid il/skill file"
-            return json.dumps(result_dict, ensure_ascii=False)
+            return result_dict
         
         # Use load command to execute SKILL file directly (avoids port forwarding truncation issues)
         abs_path = str(skill_path.resolve())
@@ -263,7 +254,7 @@ def run_il_with_screenshot(il_file_path: str, lib: str, cell: str, screenshot_pa
         
         # Check if load was successful (returns 't' or empty string on success)
         if load_result and load_result.strip().lower() in {'t', 't\n', ''}:
-            result_dict["observations"].append(f"✅ SKILL script {skill_path.name} executed successfully")
+            observe(f"✅ SKILL script {skill_path.name} executed successfully")
         else:
             # Return detailed error information
             result_dict["message"] = f"❌ il file {skill_path.name} execution failed"
@@ -272,20 +263,20 @@ def run_il_with_screenshot(il_file_path: str, lib: str, cell: str, screenshot_pa
                 # Clean up error message for better readability
                 safe_error = error_details.replace('\n', ' ').replace('\r', ' ').strip()
                 if safe_error and safe_error.lower() not in {'nil', 'none'}:
-                    result_dict["observations"].append(f"Error Details: {safe_error}")
+                    observe(f"Error Details: {safe_error}")
                 else:
-                    result_dict["observations"].append("Failed to load SKILL file (check Virtuoso connection and file path)")
+                    observe("Failed to load SKILL file (check Virtuoso connection and file path)")
             else:
-                result_dict["observations"].append("Failed to load SKILL file (empty result - check Virtuoso connection and file path)")
-            return json.dumps(result_dict, ensure_ascii=False)
+                observe("Failed to load SKILL file (empty result - check Virtuoso connection and file path)")
+            return result_dict
         # Save current cellview after load to persist generated content
         try:
             if save_current_cellview(timeout=30):
-                result_dict["observations"].append("💾 CellView saved successfully after load")
+                observe("💾 CellView saved successfully after load")
             else:
-                result_dict["observations"].append("❌ Failed to save CellView after load")
+                observe("❌ Failed to save CellView after load")
         except Exception as se:
-            result_dict["observations"].append(f"❌ Exception during save: {se}")
+            observe(f"❌ Exception during save: {se}")
         ui_redraw(timeout=10)
         ui_zoom_absolute_scale(0.9, timeout=10)
         sleep(2.0)
@@ -307,15 +298,32 @@ def run_il_with_screenshot(il_file_path: str, lib: str, cell: str, screenshot_pa
             result_dict["status"] = "success"
             result_dict["message"] = f"✅ il file {skill_path.name} executed successfully"
             result_dict["screenshot_path"] = save_path
-            result_dict["observations"].append(f"📸 Screenshot saved: {save_path}")
+            observe(f"📸 Screenshot saved: {save_path}")
         else:
             result_dict["message"] = "❌ Screenshot failed"
             
     except Exception as e:
         result_dict["message"] = f"❌ Error occurred while running il file: {e}"
-        result_dict["observations"].append(f"❌ Exception occurred: {str(e)}")
+        observe(f"❌ Exception occurred: {str(e)}")
     
-    return json.dumps(result_dict, ensure_ascii=False) 
+    return result_dict
+
+@tool
+def run_il_with_screenshot(il_file_path: str, lib: str, cell: str, screenshot_path: Optional[str] = None, view: str = "layout") -> str:
+    """
+    Run il file using skillbridge library and save screenshot
+    
+    Args:
+        il_file_path: Path to il file (can be relative or absolute path)
+        lib: target library name (required)
+        cell: target cell name (required)
+        screenshot_path: Optional absolute/relative path to save the screenshot. If None, will save to output/screenshots/virtuoso_<stem>_<timestamp>.png
+        view: target view name (default: "layout")
+        
+    Returns:
+        JSON format string containing execution status, screenshot path and observation information
+    """
+    return json.dumps(run_il_with_screenshot_obj(il_file_path, lib, cell, screenshot_path=screenshot_path, view=view), ensure_ascii=False)
 
 @tool
 def clear_all_figures_in_window() -> str:
@@ -338,20 +346,8 @@ def clear_all_figures_in_window() -> str:
     except Exception as e:
         return f"❌ Error occurred while executing clear operation: {e}" 
 
-@tool
-def screenshot_current_window(lib: Optional[str] = None, cell: Optional[str] = None, view: str = "layout") -> str:
-    """
-    Take screenshot of current Virtuoso window only, without running IL file.
-    If lib and cell are provided, opens the specified cellview window before taking screenshot.
-    
-    Args:
-        lib: Library name (optional)
-        cell: Cell name (optional)
-        view: View name (default: layout)
-    
-    Returns:
-        JSON string containing screenshot path, status and timestamp.
-    """
+def screenshot_current_window_obj(lib: Optional[str] = None, cell: Optional[str] = None, view: str = "layout") -> Dict[str, Any]:
+    """Take screenshot of current Virtuoso window, returning the result as a dict (see screenshot_current_window)"""
     result = {
         "status": "error",
         "message": "",
@@ -364,7 +360,7 @@ def screenshot_current_window(lib: Optional[str] = None, cell: Optional[str] = N
             window_ok = ge_open_window(lib, cell, view=view, view_type=None, mode="a", timeout=30)
             if not window_ok:
                 result["message"] = f"❌ Error: Failed to open window for {lib}/{cell}/{view}"
-                return json.dumps(result, ensure_ascii=False)
+                return result
             ui_redraw(timeout=10)
             sleep(0.5)
         
@@ -401,7 +397,23 @@ def screenshot_current_window(lib: Optional[str] = None, cell: Optional[str] = N
             result["message"] = f"❌ Screenshot failed: {err}"
     except Exception as e:
         result["message"] = f"❌ Exception occurred: {e}"
-    return json.dumps(result, ensure_ascii=False) 
+    return result
+
+@tool
+def screenshot_current_window(lib: Optional[str] = None, cell: Optional[str] = None, view: str = "layout") -> str:
+    """
+    Take screenshot of current Virtuoso window only, without running IL file.
+    If lib and cell are provided, opens the specified cellview window before taking screenshot.
+    
+    Args:
+        lib: Library name (optional)
+        cell: Cell name (optional)
+        view: View name (default: layout)
+    
+    Returns:
+        JSON string containing screenshot path, status and timestamp.
+    """
+    return json.dumps(screenshot_current_window_obj(lib=lib, cell=cell, view=view), ensure_ascii=False)
 
 @tool
 def get_current_cellview_info(lib: Optional[str] = None, cell: Optional[str] = None, view: str = "layout") -> str:
@@ -31,7 +31,8 @@ def create_python_helper(
     description: str,
     function_body: str,
     parameters: str = "{}",
-    return_type: str = "str"
+    return_type: str = "str",
+    module_preamble: str = ""
 ) -> str:
     """
     Create a reusable Python helper tool from code snippet.
@@ -45,6 +46,8 @@ def create_python_helper(
         function_body: Python code for the function body (without def line)
         parameters: JSON string defining parameters, e.g., '{"file_path": "str"}'
         return_type: Return type annotation (default: "str")
+        module_preamble: Optional module-level code placed above the function,
+            e.g. imports and compiled regexes that should run once, not per call
         
     Returns:
         Success message with usage example
@@ -83,7 +86,7 @@ Created: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")}
 """
 
 from smolagents import tool
-
+{_format_preamble(module_preamble)}
 @tool
 def {tool_name}({params_str}) -> {return_type}:
     """
@@ -202,8 +205,9 @@ def update_python_helper(tool_name: str, function_body: str) -> str:
             content = f.read()
         
         # Find function body and replace
-        # Match content from def line to end of file
-        pattern = r'(def\s+\w+\([^)]*\)\s*->\s*\w+:\s*""".*?""")(.*)'
+        # Match content from the @tool function's def line to end of file;
+        # anchored on its name so defs in a module preamble are skipped
+        pattern = rf'(@tool\s+def\s+{re.escape(tool_name)}\([^)]*\)\s*->\s*[^:]+:\s*""".*?""")(.*)'
         match = re.search(pattern, content, re.DOTALL)
         
         if not match:
@@ -293,6 +297,13 @@ def _generate_param_docs(params_dict: dict) -> str:
     return '\n'.join(docs)
 
 
+def _format_preamble(module_preamble: str) -> str:
+    """Format module-level code to sit between the imports and the @tool function"""
+    if not module_preamble.strip():
+        return ''
+    return '\n' + module_preamble.strip() + '\n\n'
+
+
 def _indent_code(code: str, spaces: int) -> str:
     """Add indentation to code"""
     indent = ' ' * spaces
@@ -6,6 +6,7 @@ Allows AI to modify user preferences across sessions
 """
 
 import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional
 from smolagents import tool
@@ -34,6 +35,13 @@ def get_profile_path(username: Optional[str] = None) -> Path:
     return PROFILE_DIR / f"{username}_profile.md"
 
 
+@lru_cache(maxsize=1)
+def _read_profile_text(profile_path: str, mtime_ns: int) -> str:
+    """Read profile text; keyed by mtime so an edited file is read again"""
+    with open(profile_path, 'r', encoding='utf-8') as f:
+        return f.read()
+
+
 def read_profile(username: Optional[str] = None) -> str:
     """Read user profile content, create from default if not exists"""
     profile_path = get_profile_path(username)
@@ -58,8 +66,7 @@ def read_profile(username: Optional[str] = None) -> str:
             return ""
     
     try:
-        with open(profile_path, 'r', encoding='utf-8') as f:
-            return f.read()
+        return _read_profile_text(str(profile_path), profile_path.stat().st_mtime_ns)
     except Exception as e:
         print(f"⚠️  Error reading profile file {profile_path}: {e}")
         return ""
@@ -93,6 +100,8 @@ def update_user_profile(new_content: str, username: Optional[str] = None) -> str
     try:
         with open(profile_path, 'w', encoding='utf-8') as f:
             f.write(new_content)
+        # The rewrite may land within the same mtime tick as the cached read
+        _read_profile_text.cache_clear()
         return f"✅ User profile updated: {profile_path}"
     except Exception as e:
         return f"❌ Failed to update profile: {e}"
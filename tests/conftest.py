@@ -0,0 +1,19 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""Shared pytest setup for the tests package."""
+
+import importlib.util
+import sys
+import types
+
+# Tool modules decorate their entry points with smolagents.tool; stub it once
+# per session when smolagents is not installed so they can still be imported.
+# The real package is never shadowed, as other tests need its full API.
+if "smolagents" not in sys.modules and importlib.util.find_spec("smolagents") is None:
+    smolagents_stub = types.ModuleType("smolagents")
+
+    def tool(func):
+        return func
+
+    smolagents_stub.tool = tool
+    sys.modules["smolagents"] = smolagents_stub
@@ -14,232 +14,468 @@ Usage:
     python run_io_ring_batch.py --start-index 1 --stop-index 10 --model-name deepseek
 """
 
-# ============================================================================
-# Pad Layout Templates Registry
-# ============================================================================
-
-PAD_LAYOUTS = {
-    "3x3_single_ring_digital": {
-        "description": "3 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "RSTN SCK SDI SDO D4 D3 D2 D1 VIOL GIOL VIOH GIOH",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}\n\nSignal names: {signals}\n\nVoltage domain requirements:\n- Digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH)\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}"
-    },
-    "3x3_single_ring_analog": {
-        "description": "3 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VCM IBAMP IBREF AVDD AVSS VIN VIP VAMP IBAMP IBREF VDDIB VSSIB",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, analog signals use analog domain voltage domain (VDDIB/VSSIB).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "4x4_single_ring_digital": {
-        "description": "4 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "RSTN SCK SDI SDO D8 D7 D6 D5 D4 D3 D2 D1 IOVDDH IOVSS IOVDDL VSS",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, digital IO signals need to connect to digital domain voltage domain (IOVDDH/IOVSS/IOVDDL/VSS).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "4x4_single_ring_analog": {
-        "description": "4 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS IB0 IB1 IB2 IB3 IBIAS IBIAS2 VAMP VAMP2",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, analog signals use analog domain voltage domain (AVDD/AVSS).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "5x5_single_ring_digital": {
-        "description": "5 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 VIOL GIOL VIOH GIOH",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "5x5_single_ring_analog": {
-        "description": "5 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS VREF1 VREF2 VREF3 VREF4 IBIAS IBIAS2 VAMP VAMP2 VAMP3 VAMP4 VAMP5 VAMP6",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, analog signals use analog domain voltage domain (AVDD/AVSS).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "6x6_single_ring_digital": {
-        "description": "6 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 VIOL GIOL VIOH GIOH",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "6x6_single_ring_analog": {
-        "description": "6 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS VREF1 VREF2 VREF3 VREF4 IBIAS IBIAS2 VAMP VAMP2 VAMP3 VAMP4 VAMP5 VAMP6 VAMP7 VAMP8 VAMP9 VAMP10",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, analog signals use analog domain voltage domain (AVDD/AVSS).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "7x7_single_ring_digital": {
-        "description": "7 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 VIOL GIOL VIOH GIOH",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "7x7_single_ring_analog": {
-        "description": "7 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS VREF1 VREF2 VREF3 VREF4 IBIAS IBIAS2 VAMP VAMP2 VAMP3 VAMP4 VAMP5 VAMP6 VAMP7 VAMP8 VAMP9 VAMP10 VAMP11 VAMP12 VAMP13 VAMP14",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, analog signals use analog domain voltage domain (AVDD/AVSS).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "3x3_single_ring_mixed": {
-        "description": "3 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VIN VSSIB VDDIB VCM D4 D3 D2 D1 VIOL GIOL VIOH GIOH",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, analog signals use analog domain voltage domain (VDDIB/VSSIB), digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "4x4_single_ring_mixed": {
-        "description": "4 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VIN VIP VCM AVDD AVSS D0 D1 D2 D3 VIOL GIOL VIOH GIOH RSTN SCK SDI",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, analog signals use analog domain voltage domain (AVDD/AVSS), digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "5x5_single_ring_mixed": {
-        "description": "5 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "D0 D1 D2 D3 SCK SDI SDO RST SYNC IBREF AVDD AVSS VIN VIP VSSSAR VDDSAR VIOL GIOL VIOH GIOH",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH), analog signals use analog domain voltage domain (VSSSAR/VDDSAR).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "10x6_single_ring_mixed_1": {
-        "description": "10 pads on left and right sides, 6 pads on top and bottom sides. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 SCK SDI SDO RST SYNC CLKO VIOL GIOL VIOH GIOH VCM3 VCM2 VCM IBAMP IBREF AVDD AVSS VIN VIP GND VDDI VSSI",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH), analog signals use analog domain voltage domain (AVDD/AVSS).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "10x6_single_ring_mixed_2": {
-        "description": "10 pads on left and right sides, 6 pads on top and bottom sides. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 SDI SDO VIOL GIOL VIOH GIOH",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, analog signals use analog domain voltage domain (AVDD/AVSS), digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "8x8_double_ring_analog": {
-        "description": "8 pads per side. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS VREF1 VREF2 VREF3 VREF4 IBIAS IBIAS2 VAMP VAMP2 VAMP3 VAMP4 VAMP5 VAMP6 VAMP7 VAMP8 VAMP9 VAMP10 VAMP11 VAMP12 VAMP13 VAMP14 VAMP15 VAMP16 VAMP17 VAMP18",
-        "inner_pads": [
-            {"signal": "VREF_CORE", "between": ["VREF", "AVDD"]},
-            {"signal": "VAMP_CORE", "between": ["VAMP", "VAMP2"]},
-            {"signal": "IBIAS_CORE", "between": ["IBIAS", "IBIAS2"]},
-            {"signal": "VCM_CORE", "between": ["VIM", "VCM"]}
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VREF and AVDD, insert an inner ring pad VAMP_CORE between VAMP and VAMP2, insert an inner ring pad IBIAS_CORE between IBIAS and IBIAS2, insert an inner ring pad VCM_CORE between VIM and VCM. Among them, analog signals use analog domain voltage domain (AVDD/AVSS), digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "8x8_double_ring_digital": {
-        "description": "8 pads per side. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 D24 D25 D26 D27 VIOL GIOL VIOH GIOH",
-        "inner_pads": [
-            {"signal": "D28", "between": ["D26", "D27"]},
-            {"signal": "D29", "between": ["D27", "VIOL"]},
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad D28 between D26 and D27, insert an inner ring pad D29 between D27 and VIOL. Among them digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "8x8_double_ring_mixed": {
-        "description": "8 pads per side. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 VIOL GIOL VIOH GIOH",
-        "inner_pads": [
-            {"signal": "VREF_CORE", "between": ["VCM", "VREF"]},
-            {"signal": "D24", "between": ["D22", "D23"]},
-            {"signal": "VAMP_CORE", "between": ["VINP", "VINN"]},
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VCM and VREF, insert an inner ring pad D24 between D22 and D23, insert an inner ring pad VAMP_CORE between VINP and VINN. Among them, analog signals use analog domain voltage domain (AVDD/AVSS), digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "12x12_single_ring_multi_voltage_domain_1": {
-        "description": "12 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "DCLK SYNC VIOL GIOL VIOH GIOH VDD3 IB3 VDD12 IB12 VDD_CDAC VREFDES IBREF VSS IBUF_IBIAS VSS VDDIB VSSIB VINP VINN VSSIB VINCM GND_CKB VDD_CKB CLKP CLKN VDD_DAT GND_DAT VCM VSSCLK VDDCLK VDDSAR VSSSAR VREFH VREFM VREFN VREFDES2 IBREF2 SLP SDI SCK SDO RST D0 D1 D2 D3 D4",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, from VDD3 to VINCM use VSSIB and VDDIB as voltage domain, from GND_CKB to CLKN use GND_CKB and VDD_CKB as voltage domain, from VDD_DAT to VSSSAR use VDD_DAT and GND_DAT as voltage domain, from VREFH to IBREF2 use VREFH and VREFN as voltage domain. these voltage domains use PVDD3AC and PVSS3AC. Digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH)\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "12x12_single_ring_multi_voltage_domain_2": {
-        "description": "12 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "RSTN SCK SDI SDO D8 D7 D6 D5 D4 D3 D2 D1 D0 SLP IOVDDH IOVSS IOVDDL VSS DVSS DVDD VCALB VCALF IBIAS3N IBIAS2N VAMP IBIAS1P VCM AVDD AVSS VINN VINP AVDDBUF IBUF1P IBUF2N IBUF3N IBVREF CBVDD CKVSS CLKINN CLKINP CKVDD RVSS REFIN IBIAS_REF RVDD RVDDH IBIAS IBIAS2",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Among them, from DVSS to VCALF use DVSS and DVDD as voltage domain, from IBIAS3N to CBVDD use AVDD and AVSS as voltage domain, from CKVSS to CKVDD use CKVSS and CKVDD as voltage domain, from RVSS to IBIAS2 use RVSS and RVDD as voltage domain, these all use PVSS3AC and PVSS3AC. Digital IO signals need to connect to digital domain voltage domain (IOVDDH/IOVSS/IOVDDL/VSS)\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "8x8_double_ring_multi_voltage_domain": {
-        "description": "8 pads per side. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF IBVREF VDDIB VSSIB VDD_CKB CLKN CLKP VSS_CKB  D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 VIOL GIOL VIOH GIOH",
-        "inner_pads": [
-            {"signal": "VREF_CORE", "between": ["VCM", "VREF"]},
-            {"signal": "D16", "between": ["D14", "D15"]},
-            {"signal": "VAMP_CORE", "between": ["VINP", "VINN"]},
-            {"signal": "IBIAS_CORE", "between": ["VIP", "VIM"]}
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VCM and VREF, insert an inner ring pad D16 between D14 and D15, insert an inner ring pad VAMP_CORE between VINP and VINN, insert an inner ring pad IBIAS_CORE between VIP and VIM. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VINP to VSSIB uses VDDIB and VSSIB as voltage domain. From VDD_CKB to VSS_CKB uses VDD_CKB and VSS_CKB as voltage domain.\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "10x10_double_ring_multi_voltage_domain": {
-        "description": "10 pads per side. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS VDDIB VSSIB VDD_CKB VSS_CKB VDD_DAT VSS_DAT VREFH VREFN VDD_ADC VSS_ADC VDD_DAC VSS_DAC D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 VIOL GIOL VIOH GIOH",
-        "inner_pads": [
-            {"signal": "VREF_CORE", "between": ["VCM", "VREF"]},
-            {"signal": "VAMP_CORE", "between": ["VINP", "VINN"]},
-            {"signal": "ADC_CORE", "between": ["VDD_ADC", "VSS_ADC"]},
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VCM and VREF, insert an inner ring pad VAMP_CORE between VINP and VINN, insert an inner ring pad IBIAS_CORE between VIP and VIM, insert an inner ring pad ADC_CORE between VDD_ADC and VSS_ADC. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VINP to VREF uses AVDD and AVSS as voltage domain. From VDDIB to VSSIB uses VDDIB and VSSIB as voltage domain. From VDD_CKB to VSS_CKB uses VDD_CKB and VSS_CKB as voltage domain. From VDD_DAT to VSS_DAT uses VDD_DAT and VSS_DAT as voltage domain. From VREFH to VREFN uses VREFH and VREFN as voltage domain. From VDD_ADC to VSS_ADC uses VDD_ADC and VSS_ADC as voltage domain. From VDD_DAC to VSS_DAC uses VDD_DAC and VSS_DAC as voltage domain.\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "12x12_double_ring_mixed": {
-        "description": "12 pads per side. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "VINP VINN VIP VIM VCM VREF AVDD AVSS D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 D24 D25 D26 D27 D28 D29 D30 D31 D32 D33 D34 D35 VIOL GIOL VIOH GIOH",
-        "inner_pads": [
-            {"signal": "VREF_CORE", "between": ["VCM", "VREF"]},
-            {"signal": "VAMP_CORE", "between": ["VINP", "VINN"]},
-            {"signal": "IBIAS_CORE", "between": ["VIP", "VIM"]}
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VCM and VREF, insert an inner ring pad VAMP_CORE between VINP and VINN, insert an inner ring pad IBIAS_CORE between VIP and VIM. Among them, analog signals use analog domain voltage domain (AVDD/AVSS), digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "12x18_double_ring_mixed": {
-        "description": "12 pads on left and right sides, 18 pads on top and bottom sides. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "IB0 IB1 IB2 IB3 IB4 IB5 IB6 IB7 VDDGM VSSGM VCMGM VDDA09 VSSA VDDA18 VCM GND VIP VIN GND VCM09 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 CLKO SLP RST SCK SDI SDO VIOH VIOL GIOH GIOL VAMP IBIAS IBIAS2 VREFIB VREFIB2",
-        "inner_pads": [
-            {"signal": "D14", "between": ["D13", "D12"]},
-            {"signal": "MARKER", "between": ["D12", "D11"]}
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad D14 between D13 and D12, insert an inner ring pad MARKER between D12 and D11. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. Analog signals use analog domain voltage domain (VDDGM/VSSGM).\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "18x12_single_ring_mixed": {
-        "description": "18 pads on left and right sides, 12 pads on top and bottom sides. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 CS EN TEST VIOH VIOL GIOH GIOL VSSSAR VDDSAR VIP VIN VCM VINCM IBIAS IBIAS2 VREF VREF2 IB0 IB1 IB2 IB3 IB4 IB5 IB6 IB7 IB8 IB9 IB10 IB11 IB12 IB13 IB14 IB15 IB16 IB17 IB18 IB19 IB20 IB21 IB22 IB23 IB24 IB25 IB26",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. Analogs domain uses VDDSAR/VSSSAR as voltage domain.\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "12x12_double_ring_multi_voltage_domain_1": {
-        "description": "12 pads per side. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 SCK SDI SDO RST SYNC VIOH GIOH VIOL GIOL VCM IBAMP IBREF AVDD AVSS VIN VIP IB1 IB2 IB3 IB4 IB5 IB6 IB7 IB8 VDD_CKB VSS_CKB CLKP CLKN IBIAS IBIAS2 IBIAS3 IBIAS4 VDDSAR VSSSAR IBIAS5 IBIAS6 IBIAS7 IBIAS8",
-        "inner_pads": [
-            {"signal": "VCM2", "between": ["VCM", "IBAMP"]},
-            {"signal": "D10", "between": ["D8", "D9"]}
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad VCM2 between VCM and IBAMP, insert an inner ring pad D10 between D8 and D9. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VCM to IB8 uses AVDD and AVSS as voltage domain. From VDD_CKB to CLKN uses VDD_CKB and VSS_CKB as voltage domain. From IBIAS to IBIAS8 uses VDDSAR and VSSSAR as voltage domain.\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "12x12_double_ring_multi_voltage_domain_2": {
-        "description": "12 pads on left and right sides, 12 pads on top and bottom sides. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "AVDD AVSS VIN VIP GND VCM VCM2 VCM3 IBREF IBREF2 IBVIAS IBVIAS2 VCM4 VCM5 VCM6 VSSIB VDDIB IB0 IB1 IB2 IB3 IB4 IB5 IB6 IB7 D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 SCK SDI SDO RST SYNC CLKO FLAG GIOL VIOL GIOH VIOH",
-        "inner_pads": [
-            {"signal": "D12", "between": ["D9", "D10"]},
-            {"signal": "VCM1", "between": ["VCM", "VCM2"]}
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad D12 between D9 and D10, insert an inner ring pad VCM1 between VCM and VCM2. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From AVDD to IB7 uses AVDD and AVSS as voltage domain. From IBREF to VDDIB uses VDDIB and VSSIB as voltage domain.\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "12x18_double_ring_multi_voltage_domain": {
-        "description": "12 pads on left and right sides, 18 pads on top and bottom sides. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "DCLK SYNC VIOL GIOL VIOH GIOH VDD3 IB3 VDD12 IB12 VDD_CDAC VREFDES IBREF VSS IBUF_IBIAS VDDIB VSSIB VINP VINN VINCM GND_CKB VDD_CKB CLKP CLKN VDD_DAT GND_DAT VCM VSSCLK VDDCLK AVDD AVSS VDDSAR VSSSAR VREFDES2 IBREF2 VREFDES3 IBREF3 SLP SDI SCK SDO RST D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 CS EN RSTN MCLK SCLK LRCK",
-        "inner_pads": [
-            {"signal": "VSS_CDAC", "between": ["VDD_CDAC", "VREFDES"]},
-            {"signal": "D12", "between": ["D10", "D11"]},
-            {"signal": "BIAS2", "between": ["IBUF_IBIAS", "VDDIB"]}
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad VSS_CDAC between VDD_CDAC and VREFDES, insert an inner ring pad D12 between D10 and D11, insert an inner ring pad BIAS2 between IBUF_IBIAS and VDDIB. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VDD3 to VINCM uses VDDIB and VSSIB as voltage domain. From GND_CKB to CLKN uses VDD_CKB and GND_CKB as voltage domain. From VDD_DAT to IBREF3 uses VDD_DAT and GND_DAT as voltage domain. these voltage domains use PVDD3AC and PVSS3AC. Digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH)\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "18x18_single_ring_multi_voltage_domain": {
-        "description": "18 pads per side. Single ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "DCLK SYNC VIOL GIOL VIOH GIOH VDD3 IB3 VDD12 IB12 VDD_CDAC VREFDES IBREF VSS IBUF_IBIAS VDDIB VSSIB VINP VINN VINCM GND_CKB VDD_CKB CLKP CLKN VDD_DAT GND_DAT VCM VSSCLK VDDCLK VDDSAR VSSSAR VREFDES2 IBREF2 VREFDES3 IBREF3 SLP SDI SCK SDO RST D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 CS EN TEST RSTN MCLK SCLK LRCK DIN DOUT DOUT1 DOUT2 DOUT3 DOUT4 DOUT5 DOUT6 DOUT7",
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VDD3 to VINCM uses VDDIB and VSSIB as voltage domain. From GND_CKB to CLKN uses VDD_CKB and GND_CKB as voltage domain. From VDD_DAT to IBREF3 uses VDD_DAT and GND_DAT as voltage domain.\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-    "18x18_double_ring_multi_voltage_domain": {
-        "description": "18 pads per side. Double ring layout. Order: counterclockwise through left side, bottom side, right side, top side.",
-        "signals": "DCLK SYNC VIOL GIOL VIOH GIOH VDD3 IB3 VDD12 IB12 VDD_CDAC VREFDES IBREF VSS IBUF_IBIAS VDDIB VSSIB VINP VINN VINCM GND_CKB VDD_CKB CLKP CLKN VDD_DAT GND_DAT VCM VSSCLK VDDCLK AVDD AVSS VDDSAR VSSSAR VREFDES2 IBREF2 VREFDES3 IBREF3 SLP SDI SCK SDO RST D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 CS EN TEST RSTN MCLK SCLK LRCK DIN DOUT DOUT1 DOUT2 DOUT3 DOUT4 DOUT5",
-        "inner_pads": [
-            {"signal": "VSS_CORE", "between": ["VDDSAR", "VSSSAR"]},
-            {"signal": "D16", "between": ["D14", "D15"]},
-            {"signal": "AVDD_CORE", "between": ["AVDD", "AVSS"]},
-            {"signal": "DCLK", "between": ["MCLK", "SCLK"]}
-        ],
-        "template": "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}Signal names: {signals}. Additionally, please insert an inner ring pad VSS_CORE between VDDSAR and VSSSAR, insert an inner ring pad D16 between D14 and D15, insert an inner ring pad AVDD_CORE between AVDD and AVSS, insert an inner ring pad DCLK between MCLK and SCLK. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VDD3 to VINCM uses VDDIB and VSSIB as voltage domain. From GND_CKB to CLKN uses VDD_CKB and GND_CKB as voltage domain. From VDD_DAT to IBREF3 uses VDD_DAT and GND_DAT as voltage domain\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}\n\nSteps to complete:\n1. Generate intent graph file based on the pad layout requirements\n2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n5. Verify the design meets the requirements"
-    },
-}
-
+import codecs
 import subprocess
 import sys
 import os
+import re
 import signal
 from pathlib import Path
 from datetime import datetime
 import time
-import yaml
 import tempfile
+import textwrap
+import io
+import string
 import threading
+from dataclasses import dataclass, field, replace
+from types import MappingProxyType
+from typing import Dict, Mapping, Tuple
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+# ============================================================================
+# Pad Layout Templates Registry
+# ============================================================================
+
+# Text shared by every layout prompt; each entry only holds its own
+# requirements (signal names, inner ring pads, voltage domains)
+_PREAMBLE = "Task: Generate IO ring schematic and layout design for Cadence Virtuoso.\n\nDesign requirements:\n{description}"
+_CONFIG_TAIL = "\n\nConfiguration:\n- Technology: 28nm process node\n- Library: {library_name}\n- Cell name: {cell_name}\n- View: {view_name}"
+_STEPS_TAIL = (
+    "\n\nSteps to complete:\n"
+    "1. Generate intent graph file based on the pad layout requirements\n"
+    "2. Generate IO ring schematic SKILL code using generate_io_ring_schematic tool\n"
+    "3. Generate IO ring layout SKILL code using generate_io_ring_layout tool\n"
+    "4. Execute the generated SKILL code in Virtuoso to create the schematic and layout\n"
+    "5. Verify the design meets the requirements"
+)
+
+# slots=True needs Python 3.10+; older interpreters fall back to __dict__
+_DATACLASS_OPTIONS = {"frozen": True}
+if sys.version_info >= (3, 10):
+    _DATACLASS_OPTIONS["slots"] = True
+
+@dataclass(**_DATACLASS_OPTIONS)
+class InnerPad:
+    """Inner ring pad inserted between two outer ring signals"""
+    signal: str
+    between: Tuple[str, str]
+    
+    def __post_init__(self):
+        # Share name strings with the interned signal tuples of the layouts
+        object.__setattr__(self, "signal", sys.intern(self.signal))
+        object.__setattr__(self, "between", tuple(sys.intern(name) for name in self.between))
+
+@dataclass(**_DATACLASS_OPTIONS)
+class PadLayout:
+    """Registry entry describing one pad layout prompt"""
+    description: str
+    signals: Tuple[str, ...]
+    requirements: str
+    inner_pads: Tuple[InnerPad, ...] = ()
+    steps: bool = True
+    # Parsed once from the registry key by _with_key_fields()
+    pads_left_right: int = 0
+    pads_top_bottom: int = 0
+    rings: int = 0
+    kind: str = ""
+    # Space-joined signals, filled in once for the {signals} template field
+    signals_text: str = field(init=False, repr=False, compare=False)
+    # (signal, left index, right index) of each inner pad against signals
+    inner_pad_indices: Tuple[Tuple[str, int, int], ...] = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        object.__setattr__(self, "signals_text", " ".join(self.signals))
+        object.__setattr__(self, "inner_pad_indices", tuple(
+            (pad.signal, self.signals.index(pad.between[0]), self.signals.index(pad.between[1]))
+            for pad in self.inner_pads
+        ))
+
+def _describe_square(pads_per_side, ring):
+    """Pooled description of a layout with the same pad count on every side"""
+    return sys.intern(
+        f"{pads_per_side} pads per side. {ring.capitalize()} ring layout. "
+        "Order: counterclockwise through left side, bottom side, right side, top side."
+    )
+
+def _describe_rect(left_right, top_bottom, ring):
+    """Pooled description of a layout with different pad counts per side pair"""
+    return sys.intern(
+        f"{left_right} pads on left and right sides, {top_bottom} pads on top and bottom sides. "
+        f"{ring.capitalize()} ring layout. "
+        "Order: counterclockwise through left side, bottom side, right side, top side."
+    )
+
+def _split_signals(text):
+    """Split a space-separated signal list into a tuple of interned names"""
+    return tuple(sys.intern(name) for name in text.split())
+
+# Voltage domain clauses joined into the "Among them, ..." sentence
+def _analog_clause(domain):
+    return f"analog signals use analog domain voltage domain ({domain})"
+
+def _digital_clause(domain):
+    return f"digital signals use digital domain voltage domain ({domain})"
+
+def _digital_io_clause(domain):
+    return f"digital IO signals need to connect to digital domain voltage domain ({domain})"
+
+def _voltage_requirements(*clauses):
+    """Requirements text of a layout whose only extra is its voltage domain clauses"""
+    return sys.intern("Signal names: {signals}. Among them, " + ", ".join(clauses) + ".")
+
+def _single_ring_family(sizes):
+    """
+    Generate the regular NxN single ring digital and analog layouts
+    
+    Digital layouts use data pads D0..D(4N-5) plus the digital supply pads;
+    analog layouts use the fixed analog front end plus VAMP2..VAMP(4N-14).
+    
+    Args:
+        sizes: Pads-per-side values to generate
+    
+    Returns:
+        Dict of layout key to PadLayout, digital before analog for each size
+    """
+    layouts = {}
+    for n in sizes:
+        data_pads = " ".join(f"D{i}" for i in range(4 * n - 4))
+        layouts[f"{n}x{n}_single_ring_digital"] = PadLayout(
+            description=_describe_square(n, "single"),
+            signals=_split_signals(f"{data_pads} VIOL GIOL VIOH GIOH"),
+            requirements=_voltage_requirements(_digital_clause("VIOL/GIOL/VIOH/GIOH")),
+        )
+        amp_pads = " ".join(f"VAMP{i}" for i in range(2, 4 * n - 13))
+        layouts[f"{n}x{n}_single_ring_analog"] = PadLayout(
+            description=_describe_square(n, "single"),
+            signals=_split_signals(f"VINP VINN VIP VIM VCM VREF AVDD AVSS VREF1 VREF2 VREF3 VREF4 IBIAS IBIAS2 VAMP {amp_pads}"),
+            requirements=_voltage_requirements(_analog_clause("AVDD/AVSS")),
+        )
+    return layouts
+
+_PAD_LAYOUTS: Dict[str, PadLayout] = {
+    "3x3_single_ring_digital": PadLayout(
+        description=_describe_square(3, "single"),
+        signals=_split_signals("RSTN SCK SDI SDO D4 D3 D2 D1 VIOL GIOL VIOH GIOH"),
+        steps=False,
+        requirements="\n\nSignal names: {signals}\n\nVoltage domain requirements:\n- Digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH)",
+    ),
+    "3x3_single_ring_analog": PadLayout(
+        description=_describe_square(3, "single"),
+        signals=_split_signals("VCM IBAMP IBREF AVDD AVSS VIN VIP VAMP IBAMP IBREF VDDIB VSSIB"),
+        requirements=_voltage_requirements(_analog_clause("VDDIB/VSSIB")),
+    ),
+    "4x4_single_ring_digital": PadLayout(
+        description=_describe_square(4, "single"),
+        signals=_split_signals("RSTN SCK SDI SDO D8 D7 D6 D5 D4 D3 D2 D1 IOVDDH IOVSS IOVDDL VSS"),
+        requirements=_voltage_requirements(_digital_io_clause("IOVDDH/IOVSS/IOVDDL/VSS")),
+    ),
+    "4x4_single_ring_analog": PadLayout(
+        description=_describe_square(4, "single"),
+        signals=_split_signals("VINP VINN VIP VIM VCM VREF AVDD AVSS IB0 IB1 IB2 IB3 IBIAS IBIAS2 VAMP VAMP2"),
+        requirements=_voltage_requirements(_analog_clause("AVDD/AVSS")),
+    ),
+    # 5x5 to 7x7 digital and analog layouts follow a fixed pattern
+    **_single_ring_family(range(5, 8)),
+    "3x3_single_ring_mixed": PadLayout(
+        description=_describe_square(3, "single"),
+        signals=_split_signals("VIN VSSIB VDDIB VCM D4 D3 D2 D1 VIOL GIOL VIOH GIOH"),
+        requirements=_voltage_requirements(_analog_clause("VDDIB/VSSIB"), _digital_io_clause("VIOL/GIOL/VIOH/GIOH")),
+    ),
+    "4x4_single_ring_mixed": PadLayout(
+        description=_describe_square(4, "single"),
+        signals=_split_signals("VIN VIP VCM AVDD AVSS D0 D1 D2 D3 VIOL GIOL VIOH GIOH RSTN SCK SDI"),
+        requirements=_voltage_requirements(_analog_clause("AVDD/AVSS"), _digital_io_clause("VIOL/GIOL/VIOH/GIOH")),
+    ),
+    "5x5_single_ring_mixed": PadLayout(
+        description=_describe_square(5, "single"),
+        signals=_split_signals("D0 D1 D2 D3 SCK SDI SDO RST SYNC IBREF AVDD AVSS VIN VIP VSSSAR VDDSAR VIOL GIOL VIOH GIOH"),
+        requirements=_voltage_requirements(_digital_io_clause("VIOL/GIOL/VIOH/GIOH"), _analog_clause("VSSSAR/VDDSAR")),
+    ),
+    "10x6_single_ring_mixed_1": PadLayout(
+        description=_describe_rect(10, 6, "single"),
+        signals=_split_signals("D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 SCK SDI SDO RST SYNC CLKO VIOL GIOL VIOH GIOH VCM3 VCM2 VCM IBAMP IBREF AVDD AVSS VIN VIP GND VDDI VSSI"),
+        requirements=_voltage_requirements(_digital_io_clause("VIOL/GIOL/VIOH/GIOH"), _analog_clause("AVDD/AVSS")),
+    ),
+    "10x6_single_ring_mixed_2": PadLayout(
+        description=_describe_rect(10, 6, "single"),
+        signals=_split_signals("VINP VINN VIP VIM VCM VREF AVDD AVSS D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 SDI SDO VIOL GIOL VIOH GIOH"),
+        requirements=_voltage_requirements(_analog_clause("AVDD/AVSS"), _digital_clause("VIOL/GIOL/VIOH/GIOH")),
+    ),
+    "8x8_double_ring_analog": PadLayout(
+        description=_describe_square(8, "double"),
+        signals=_split_signals("VINP VINN VIP VIM VCM VREF AVDD AVSS VREF1 VREF2 VREF3 VREF4 IBIAS IBIAS2 VAMP VAMP2 VAMP3 VAMP4 VAMP5 VAMP6 VAMP7 VAMP8 VAMP9 VAMP10 VAMP11 VAMP12 VAMP13 VAMP14 VAMP15 VAMP16 VAMP17 VAMP18"),
+        inner_pads=(
+            InnerPad("VREF_CORE", ("VREF", "AVDD")),
+            InnerPad("VAMP_CORE", ("VAMP", "VAMP2")),
+            InnerPad("IBIAS_CORE", ("IBIAS", "IBIAS2")),
+            InnerPad("VCM_CORE", ("VIM", "VCM")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VREF and AVDD, insert an inner ring pad VAMP_CORE between VAMP and VAMP2, insert an inner ring pad IBIAS_CORE between IBIAS and IBIAS2, insert an inner ring pad VCM_CORE between VIM and VCM. Among them, analog signals use analog domain voltage domain (AVDD/AVSS), digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).",
+    ),
+    "8x8_double_ring_digital": PadLayout(
+        description=_describe_square(8, "double"),
+        signals=_split_signals("D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 D24 D25 D26 D27 VIOL GIOL VIOH GIOH"),
+        inner_pads=(
+            InnerPad("D28", ("D26", "D27")),
+            InnerPad("D29", ("D27", "VIOL")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad D28 between D26 and D27, insert an inner ring pad D29 between D27 and VIOL. Among them digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).",
+    ),
+    "8x8_double_ring_mixed": PadLayout(
+        description=_describe_square(8, "double"),
+        signals=_split_signals("VINP VINN VIP VIM VCM VREF AVDD AVSS D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 VIOL GIOL VIOH GIOH"),
+        inner_pads=(
+            InnerPad("VREF_CORE", ("VCM", "VREF")),
+            InnerPad("D24", ("D14", "D15")),
+            InnerPad("VAMP_CORE", ("VINP", "VINN")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VCM and VREF, insert an inner ring pad D24 between D14 and D15, insert an inner ring pad VAMP_CORE between VINP and VINN. Among them, analog signals use analog domain voltage domain (AVDD/AVSS), digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).",
+    ),
+    "12x12_single_ring_multi_voltage_domain_1": PadLayout(
+        description=_describe_square(12, "single"),
+        signals=_split_signals("DCLK SYNC VIOL GIOL VIOH GIOH VDD3 IB3 VDD12 IB12 VDD_CDAC VREFDES IBREF VSS IBUF_IBIAS VSS VDDIB VSSIB VINP VINN VSSIB VINCM GND_CKB VDD_CKB CLKP CLKN VDD_DAT GND_DAT VCM VSSCLK VDDCLK VDDSAR VSSSAR VREFH VREFM VREFN VREFDES2 IBREF2 SLP SDI SCK SDO RST D0 D1 D2 D3 D4"),
+        requirements="Signal names: {signals}. Among them, from VDD3 to VINCM use VSSIB and VDDIB as voltage domain, from GND_CKB to CLKN use GND_CKB and VDD_CKB as voltage domain, from VDD_DAT to VSSSAR use VDD_DAT and GND_DAT as voltage domain, from VREFH to IBREF2 use VREFH and VREFN as voltage domain. these voltage domains use PVDD3AC and PVSS3AC. Digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH)",
+    ),
+    "12x12_single_ring_multi_voltage_domain_2": PadLayout(
+        description=_describe_square(12, "single"),
+        signals=_split_signals("RSTN SCK SDI SDO D8 D7 D6 D5 D4 D3 D2 D1 D0 SLP IOVDDH IOVSS IOVDDL VSS DVSS DVDD VCALB VCALF IBIAS3N IBIAS2N VAMP IBIAS1P VCM AVDD AVSS VINN VINP AVDDBUF IBUF1P IBUF2N IBUF3N IBVREF CBVDD CKVSS CLKINN CLKINP CKVDD RVSS REFIN IBIAS_REF RVDD RVDDH IBIAS IBIAS2"),
+        requirements="Signal names: {signals}. Among them, from DVSS to VCALF use DVSS and DVDD as voltage domain, from IBIAS3N to CBVDD use AVDD and AVSS as voltage domain, from CKVSS to CKVDD use CKVSS and CKVDD as voltage domain, from RVSS to IBIAS2 use RVSS and RVDD as voltage domain, these all use PVSS3AC and PVSS3AC. Digital IO signals need to connect to digital domain voltage domain (IOVDDH/IOVSS/IOVDDL/VSS)",
+    ),
+    "8x8_double_ring_multi_voltage_domain": PadLayout(
+        description=_describe_square(8, "double"),
+        signals=_split_signals("VINP VINN VIP VIM VCM VREF IBVREF VDDIB VSSIB VDD_CKB CLKN CLKP VSS_CKB D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 VIOL GIOL VIOH GIOH"),
+        inner_pads=(
+            InnerPad("VREF_CORE", ("VCM", "VREF")),
+            InnerPad("D16", ("D14", "D15")),
+            InnerPad("VAMP_CORE", ("VINP", "VINN")),
+            InnerPad("IBIAS_CORE", ("VIP", "VIM")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VCM and VREF, insert an inner ring pad D16 between D14 and D15, insert an inner ring pad VAMP_CORE between VINP and VINN, insert an inner ring pad IBIAS_CORE between VIP and VIM. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VINP to VSSIB uses VDDIB and VSSIB as voltage domain. From VDD_CKB to VSS_CKB uses VDD_CKB and VSS_CKB as voltage domain.",
+    ),
+    "10x10_double_ring_multi_voltage_domain": PadLayout(
+        description=_describe_square(10, "double"),
+        signals=_split_signals("VINP VINN VIP VIM VCM VREF AVDD AVSS VDDIB VSSIB VDD_CKB VSS_CKB VDD_DAT VSS_DAT VREFH VREFN VDD_ADC VSS_ADC VDD_DAC VSS_DAC D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 VIOL GIOL VIOH GIOH"),
+        inner_pads=(
+            InnerPad("VREF_CORE", ("VCM", "VREF")),
+            InnerPad("VAMP_CORE", ("VINP", "VINN")),
+            InnerPad("IBIAS_CORE", ("VIP", "VIM")),
+            InnerPad("ADC_CORE", ("VDD_ADC", "VSS_ADC")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VCM and VREF, insert an inner ring pad VAMP_CORE between VINP and VINN, insert an inner ring pad IBIAS_CORE between VIP and VIM, insert an inner ring pad ADC_CORE between VDD_ADC and VSS_ADC. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VINP to VREF uses AVDD and AVSS as voltage domain. From VDDIB to VSSIB uses VDDIB and VSSIB as voltage domain. From VDD_CKB to VSS_CKB uses VDD_CKB and VSS_CKB as voltage domain. From VDD_DAT to VSS_DAT uses VDD_DAT and VSS_DAT as voltage domain. From VREFH to VREFN uses VREFH and VREFN as voltage domain. From VDD_ADC to VSS_ADC uses VDD_ADC and VSS_ADC as voltage domain. From VDD_DAC to VSS_DAC uses VDD_DAC and VSS_DAC as voltage domain.",
+    ),
+    "12x12_double_ring_mixed": PadLayout(
+        description=_describe_square(12, "double"),
+        signals=_split_signals("VINP VINN VIP VIM VCM VREF AVDD AVSS D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 D16 D17 D18 D19 D20 D21 D22 D23 D24 D25 D26 D27 D28 D29 D30 D31 D32 D33 D34 D35 VIOL GIOL VIOH GIOH"),
+        inner_pads=(
+            InnerPad("VREF_CORE", ("VCM", "VREF")),
+            InnerPad("VAMP_CORE", ("VINP", "VINN")),
+            InnerPad("IBIAS_CORE", ("VIP", "VIM")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad VREF_CORE between VCM and VREF, insert an inner ring pad VAMP_CORE between VINP and VINN, insert an inner ring pad IBIAS_CORE between VIP and VIM. Among them, analog signals use analog domain voltage domain (AVDD/AVSS), digital signals use digital domain voltage domain (VIOL/GIOL/VIOH/GIOH).",
+    ),
+    "12x18_double_ring_mixed": PadLayout(
+        description=_describe_rect(12, 18, "double"),
+        signals=_split_signals("IB0 IB1 IB2 IB3 IB4 IB5 IB6 IB7 VDDGM VSSGM VCMGM VDDA09 VSSA VDDA18 VCM GND VIP VIN GND VCM09 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 CLKO SLP RST SCK SDI SDO VIOH VIOL GIOH GIOL VAMP IBIAS IBIAS2 VREFIB VREFIB2"),
+        inner_pads=(
+            InnerPad("D14", ("D13", "D12")),
+            InnerPad("MARKER", ("D12", "D11")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad D14 between D13 and D12, insert an inner ring pad MARKER between D12 and D11. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. Analog signals use analog domain voltage domain (VDDGM/VSSGM).",
+    ),
+    "18x12_single_ring_mixed": PadLayout(
+        description=_describe_rect(18, 12, "single"),
+        signals=_split_signals("D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 CS EN TEST VIOH VIOL GIOH GIOL VSSSAR VDDSAR VIP VIN VCM VINCM IBIAS IBIAS2 VREF VREF2 IB0 IB1 IB2 IB3 IB4 IB5 IB6 IB7 IB8 IB9 IB10 IB11 IB12 IB13 IB14 IB15 IB16 IB17 IB18 IB19 IB20 IB21 IB22 IB23 IB24 IB25 IB26"),
+        requirements="Signal names: {signals}. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. Analogs domain uses VDDSAR/VSSSAR as voltage domain.",
+    ),
+    "12x12_double_ring_multi_voltage_domain_1": PadLayout(
+        description=_describe_square(12, "double"),
+        signals=_split_signals("D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 SCK SDI SDO RST SYNC VIOH GIOH VIOL GIOL VCM IBAMP IBREF AVDD AVSS VIN VIP IB1 IB2 IB3 IB4 IB5 IB6 IB7 IB8 VDD_CKB VSS_CKB CLKP CLKN IBIAS IBIAS2 IBIAS3 IBIAS4 VDDSAR VSSSAR IBIAS5 IBIAS6 IBIAS7 IBIAS8"),
+        inner_pads=(
+            InnerPad("VCM2", ("VCM", "IBAMP")),
+            InnerPad("D10", ("D8", "D9")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad VCM2 between VCM and IBAMP, insert an inner ring pad D10 between D8 and D9. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VCM to IB8 uses AVDD and AVSS as voltage domain. From VDD_CKB to CLKN uses VDD_CKB and VSS_CKB as voltage domain. From IBIAS to IBIAS8 uses VDDSAR and VSSSAR as voltage domain.",
+    ),
+    "12x12_double_ring_multi_voltage_domain_2": PadLayout(
+        description=_describe_rect(12, 12, "double"),
+        signals=_split_signals("AVDD AVSS VIN VIP GND VCM VCM2 VCM3 IBREF IBREF2 IBVIAS IBVIAS2 VCM4 VCM5 VCM6 VSSIB VDDIB IB0 IB1 IB2 IB3 IB4 IB5 IB6 IB7 D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 SCK SDI SDO RST SYNC CLKO FLAG GIOL VIOL GIOH VIOH"),
+        inner_pads=(
+            InnerPad("D12", ("D9", "D10")),
+            InnerPad("VCM1", ("VCM", "VCM2")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad D12 between D9 and D10, insert an inner ring pad VCM1 between VCM and VCM2. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From AVDD to IB7 uses AVDD and AVSS as voltage domain. From IBREF to VDDIB uses VDDIB and VSSIB as voltage domain.",
+    ),
+    "12x18_double_ring_multi_voltage_domain": PadLayout(
+        description=_describe_rect(12, 18, "double"),
+        signals=_split_signals("DCLK SYNC VIOL GIOL VIOH GIOH VDD3 IB3 VDD12 IB12 VDD_CDAC VREFDES IBREF VSS IBUF_IBIAS VDDIB VSSIB VINP VINN VINCM GND_CKB VDD_CKB CLKP CLKN VDD_DAT GND_DAT VCM VSSCLK VDDCLK AVDD AVSS VDDSAR VSSSAR VREFDES2 IBREF2 VREFDES3 IBREF3 SLP SDI SCK SDO RST D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 CS EN RSTN MCLK SCLK LRCK"),
+        inner_pads=(
+            InnerPad("VSS_CDAC", ("VDD_CDAC", "VREFDES")),
+            InnerPad("D12", ("D10", "D11")),
+            InnerPad("BIAS2", ("IBUF_IBIAS", "VDDIB")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad VSS_CDAC between VDD_CDAC and VREFDES, insert an inner ring pad D12 between D10 and D11, insert an inner ring pad BIAS2 between IBUF_IBIAS and VDDIB. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VDD3 to VINCM uses VDDIB and VSSIB as voltage domain. From GND_CKB to CLKN uses VDD_CKB and GND_CKB as voltage domain. From VDD_DAT to IBREF3 uses VDD_DAT and GND_DAT as voltage domain. these voltage domains use PVDD3AC and PVSS3AC. Digital IO signals need to connect to digital domain voltage domain (VIOL/GIOL/VIOH/GIOH)",
+    ),
+    "18x18_single_ring_multi_voltage_domain": PadLayout(
+        description=_describe_square(18, "single"),
+        signals=_split_signals("DCLK SYNC VIOL GIOL VIOH GIOH VDD3 IB3 VDD12 IB12 VDD_CDAC VREFDES IBREF VSS IBUF_IBIAS VDDIB VSSIB VINP VINN VINCM GND_CKB VDD_CKB CLKP CLKN VDD_DAT GND_DAT VCM VSSCLK VDDCLK VDDSAR VSSSAR VREFDES2 IBREF2 VREFDES3 IBREF3 SLP SDI SCK SDO RST D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 CS EN TEST RSTN MCLK SCLK LRCK DIN DOUT DOUT1 DOUT2 DOUT3 DOUT4 DOUT5 DOUT6 DOUT7"),
+        requirements="Signal names: {signals}. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VDD3 to VINCM uses VDDIB and VSSIB as voltage domain. From GND_CKB to CLKN uses VDD_CKB and GND_CKB as voltage domain. From VDD_DAT to IBREF3 uses VDD_DAT and GND_DAT as voltage domain.",
+    ),
+    "18x18_double_ring_multi_voltage_domain": PadLayout(
+        description=_describe_square(18, "double"),
+        signals=_split_signals("DCLK SYNC VIOL GIOL VIOH GIOH VDD3 IB3 VDD12 IB12 VDD_CDAC VREFDES IBREF VSS IBUF_IBIAS VDDIB VSSIB VINP VINN VINCM GND_CKB VDD_CKB CLKP CLKN VDD_DAT GND_DAT VCM VSSCLK VDDCLK AVDD AVSS VDDSAR VSSSAR VREFDES2 IBREF2 VREFDES3 IBREF3 SLP SDI SCK SDO RST D0 D1 D2 D3 D4 D5 D6 D7 D8 D9 D10 D11 D12 D13 D14 D15 CS EN TEST RSTN MCLK SCLK LRCK DIN DOUT DOUT1 DOUT2 DOUT3 DOUT4 DOUT5"),
+        inner_pads=(
+            InnerPad("VSS_CORE", ("VDDSAR", "VSSSAR")),
+            InnerPad("D16", ("D14", "D15")),
+            InnerPad("AVDD_CORE", ("AVDD", "AVSS")),
+            InnerPad("DCLK", ("MCLK", "SCLK")),
+        ),
+        requirements="Signal names: {signals}. Additionally, please insert an inner ring pad VSS_CORE between VDDSAR and VSSSAR, insert an inner ring pad D16 between D14 and D15, insert an inner ring pad AVDD_CORE between AVDD and AVSS, insert an inner ring pad DCLK between MCLK and SCLK. Voltage domains: Digital domain uses VIOH, GIOH, VIOL, GIOL as voltage domain. From VDD3 to VINCM uses VDDIB and VSSIB as voltage domain. From GND_CKB to CLKN uses VDD_CKB and GND_CKB as voltage domain. From VDD_DAT to IBREF3 uses VDD_DAT and GND_DAT as voltage domain",
+    ),
+}
+
+_LAYOUT_KEY_RE = re.compile(r"(\d+)x(\d+)_(single|double)_ring_([a-z_]+?)(?:_\d+)?$")
+_INNER_PAD_RE = re.compile(r"inner ring pad (\w+) between (\w+) and (\w+)")
+
+def _with_key_fields(layouts):
+    """Fill in side pad counts, ring count and signal kind parsed from each key"""
+    result = {}
+    for layout_key, layout in layouts.items():
+        match = _LAYOUT_KEY_RE.match(layout_key)
+        if not match:
+            raise ValueError(f"Pad layout '{layout_key}': key does not match <N>x<M>_<single|double>_ring_<kind>")
+        result[layout_key] = replace(
+            layout,
+            pads_left_right=int(match.group(1)),
+            pads_top_bottom=int(match.group(2)),
+            rings=1 if match.group(3) == "single" else 2,
+            kind=match.group(4),
+        )
+    return result
+
+# Read-only view of the registry; entries are fixed once the module is loaded
+PAD_LAYOUTS: Mapping[str, PadLayout] = MappingProxyType(_with_key_fields(_PAD_LAYOUTS))
+
+def _validate_pad_layouts():
+    """Check every PAD_LAYOUTS entry against its key and its own requirements text"""
+    for layout_key, layout in PAD_LAYOUTS.items():
+        ring = "single" if layout.rings == 1 else "double"
+        if layout.description not in (
+            _describe_square(layout.pads_left_right, ring),
+            _describe_rect(layout.pads_left_right, layout.pads_top_bottom, ring),
+        ):
+            raise ValueError(f"Pad layout '{layout_key}': description does not match the key: {layout.description}")
+        
+        for pad in layout.inner_pads:
+            for neighbour in pad.between:
+                if neighbour not in layout.signals:
+                    raise ValueError(f"Pad layout '{layout_key}': inner pad {pad.signal} references unknown signal {neighbour}")
+        
+        described = {(name, (left, right)) for name, left, right in _INNER_PAD_RE.findall(layout.requirements)}
+        defined = {(pad.signal, pad.between) for pad in layout.inner_pads}
+        if described != defined:
+            raise ValueError(
+                f"Pad layout '{layout_key}': inner pads in the requirements text "
+                f"{sorted(described)} do not match inner_pads {sorted(defined)}"
+            )
+
+_validate_pad_layouts()
+
+# Project layout, resolved once at import
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_MAIN_SCRIPT = os.path.join(_PROJECT_ROOT, "main.py")
+_BENCH_DIR = Path(_PROJECT_ROOT) / "AMS-IO-Bench"
+
+# ============================================================================
+# Pad Layout Template Rendering
+# ============================================================================
+
+# Template of each PAD_LAYOUTS entry, pre-split into (literal, field_name) pairs
+# and keyed by (layout_key, include_steps)
+_COMPILED_TEMPLATES = {}
+
+@lru_cache(maxsize=None)
+def build_template(layout_key, include_steps=True):
+    """Assemble the prompt template of a PAD_LAYOUTS entry from the shared parts"""
+    layout = PAD_LAYOUTS[layout_key]
+    template = _PREAMBLE + layout.requirements + _CONFIG_TAIL
+    if layout.steps and include_steps:
+        template += _STEPS_TAIL
+    return template
+
+def _compile_templates():
+    """Parse every PAD_LAYOUTS template once so rendering skips format parsing"""
+    formatter = string.Formatter()
+    for layout_key in PAD_LAYOUTS:
+        for include_steps in (True, False):
+            _COMPILED_TEMPLATES[layout_key, include_steps] = [
+                (literal, field_name)
+                for literal, field_name, _, _ in formatter.parse(build_template(layout_key, include_steps))
+            ]
+
+@lru_cache(maxsize=256)
+def render_pad_layout(layout_key, include_steps=True, **fields):
+    """
+    Render the prompt template of a PAD_LAYOUTS entry
+    
+    Args:
+        layout_key: Key in PAD_LAYOUTS
+        include_steps: Append the "Steps to complete" list (default: True)
+        **fields: Values for library_name, cell_name and view_name; description
+            and signals default to the entry's own values
+    
+    Returns:
+        Rendered prompt text
+    """
+    layout = PAD_LAYOUTS[layout_key]
+    fields.setdefault("description", layout.description)
+    fields.setdefault("signals", layout.signals_text)
+    return "".join(
+        literal + (fields[field_name] if field_name else "")
+        for literal, field_name in _COMPILED_TEMPLATES[layout_key, include_steps]
+    )
+
+def render_compact(layout_key, **fields):
+    """Render a PAD_LAYOUTS prompt without the steps list, for agents that already have it"""
+    return render_pad_layout(layout_key, include_steps=False, **fields)
+
+_compile_templates()
 
 # ============================================================================
 # Experiment Runner
 # ============================================================================
 
+# Kill an experiment subprocess; chosen once since the platform never changes
+if sys.platform.startswith('win'):
+    def _kill_process(process):
+        process.kill()
+else:
+    def _kill_process(process):
+        # The agent runs in its own session; kill its whole process group
+        try:
+            os.killpg(os.getpgid(process.pid), signal.SIGKILL)
+        except Exception:
+            process.kill()
+
+class _DecodingWriter:
+    """Binary write()/flush() over a text stream that has no .buffer"""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self.decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    
+    def write(self, chunk):
+        self.stream.write(self.decoder.decode(chunk))
+    
+    def flush(self):
+        self.stream.flush()
+
+def _stdout_sink():
+    """Binary sink for terminal output: stdout's buffer, or a decoding wrapper"""
+    out = getattr(sys.stdout, "buffer", None)
+    return out if out is not None else _DecodingWriter(sys.stdout)
+
 def run_experiment(excel_file, sheet_name, prefix, template_type, model_name, 
                    ramic_port, ramic_host, log_dir, batch_interrupted_flag, 
                    current_process_ref, prompt_text, prompt_key):
@@ -254,8 +490,8 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
         model_name: Model name to use
         ramic_port: RAMIC bridge port number
         ramic_host: RAMIC bridge host address
-        log_dir: Directory to save logs
-        batch_interrupted_flag: Dictionary with 'flag' key for interruption signal
+        log_dir: Directory to save logs (created by the caller)
+        batch_interrupted_flag: threading.Event set when the batch is interrupted
         current_process_ref: Dictionary with 'process' key for current subprocess
         prompt_text: The actual prompt text to send to the agent
         prompt_key: Key for logging purposes
@@ -263,13 +499,11 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
     Returns:
         Dictionary with experiment results
     """
-    start_time = time.time()
-    
-    # Create log directory
-    os.makedirs(log_dir, exist_ok=True)
+    start_dt = datetime.now()
+    start_time = time.monotonic()
     
     # Generate log filename
-    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    timestamp = start_dt.strftime('%Y%m%d_%H%M%S')
     log_file = os.path.join(log_dir, f"{prompt_key}_{timestamp}.log")
     
     # Create temporary prompt file
@@ -280,7 +514,7 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
     
     try:
         # Build command
-        cmd = [sys.executable, "main.py"]
+        cmd = [sys.executable, _MAIN_SCRIPT]
         
         # Add model name if specified
         if model_name:
@@ -307,22 +541,23 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
         # Run experiment with timeout (50 minutes = 3000 seconds)
         timeout = 3000  # 50 minutes
         
-        # Function to tee output to both file and stdout
+        # Function to tee output to both file and stdout.
+        # The pipe, log file and stdout are all binary, so output is copied
+        # in whatever chunks are available (read1) instead of being split
+        # into lines and decoded/re-encoded in Python.
         def tee_output(pipe, log_file, stdout):
             """Read from pipe and write to both file and stdout"""
             try:
-                for line in iter(pipe.readline, ''):
-                    if not line:
-                        break
+                for chunk in iter(lambda: pipe.read1(65536), b''):
                     # Write to log file
                     try:
-                        log_file.write(line)
+                        log_file.write(chunk)
                         log_file.flush()
                     except (ValueError, OSError):
                         pass
                     # Write to stdout
                     try:
-                        stdout.write(line)
+                        stdout.write(chunk)
                         stdout.flush()
                     except (ValueError, OSError):
                         pass
@@ -331,12 +566,16 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
             finally:
                 pipe.close()
         
-        with open(log_file, 'w', encoding='utf-8') as log_f:
+        with open(log_file, 'wb') as log_f:
             # Write header to both file and terminal
-            header = f"Experiment: {prompt_key}\nStarted: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\nPrompt text:\n{'-'*80}\n{prompt_text}\n{'-'*80}\n\n"
-            log_f.write(header)
+            header = f"Experiment: {prompt_key}\nStarted: {start_dt.strftime('%Y-%m-%d %H:%M:%S')}\nPrompt text:\n{'-'*80}\n{prompt_text}\n{'-'*80}\n\n"
+            log_f.write(header.encode('utf-8'))
             log_f.flush()
-            print(header, end='')
+            print(header, end='', flush=True)
+            
+            # Resolve the terminal sink before Popen, so it cannot fail
+            # with the agent already running
+            stdout_sink = _stdout_sink()
             
             # Start process with PIPE for stdout/stderr
             if sys.platform.startswith('win'):
@@ -346,9 +585,7 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     env=env,
-                    text=True,
-                    encoding='utf-8',
-                    bufsize=1  # Line buffered
+                    cwd=_PROJECT_ROOT
                 )
             else:
                 process = subprocess.Popen(
@@ -357,22 +594,27 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
                     stdout=subprocess.PIPE,
                     stderr=subprocess.STDOUT,
                     env=env,
-                    text=True,
-                    encoding='utf-8',
-                    bufsize=1,  # Line buffered
-                    preexec_fn=os.setsid
+                    cwd=_PROJECT_ROOT,
+                    # Own session/process group for killpg; unlike preexec_fn
+                    # this is safe while other worker threads are running
+                    start_new_session=True
                 )
             
+            # Register the process before anything else can fail, then re-check
+            # the flag: the signal handler sets it before killing registered
+            # processes, so one of the two always sees this process
+            current_process_ref['process'] = process
+            if batch_interrupted_flag.is_set():
+                _kill_process(process)
+            
             # Start thread to tee output
             tee_thread = threading.Thread(
                 target=tee_output,
-                args=(process.stdout, log_f, sys.stdout),
+                args=(process.stdout, log_f, stdout_sink),
                 daemon=True
             )
             tee_thread.start()
             
-            current_process_ref['process'] = process
-            
             try:
                 # Prompt text is passed via environment variable PROMPT_TEXT
                 # The CLI interface will automatically use it and then exit
@@ -385,7 +627,7 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
                 # Wait for tee thread to finish reading remaining output
                 tee_thread.join(timeout=5)
                 
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.monotonic() - start_time
                 
                 if process.returncode == 0:
                     return {
@@ -406,15 +648,9 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
                     
             except subprocess.TimeoutExpired:
                 # Timeout - kill process
-                if sys.platform.startswith('win'):
-                    process.kill()
-                else:
-                    try:
-                        os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                    except Exception:
-                        process.kill()
+                _kill_process(process)
                 
-                elapsed_time = time.time() - start_time
+                elapsed_time = time.monotonic() - start_time
                 return {
                     "success": False,
                     "prompt_key": prompt_key,
@@ -425,13 +661,7 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
             
             except KeyboardInterrupt:
                 # User interrupted
-                if sys.platform.startswith('win'):
-                    process.kill()
-                else:
-                    try:
-                        os.killpg(os.getpgid(process.pid), signal.SIGKILL)
-                    except Exception:
-                        process.kill()
+                _kill_process(process)
                 raise
                 
     finally:
@@ -447,6 +677,20 @@ def run_experiment(excel_file, sheet_name, prefix, template_type, model_name,
 # Helper Functions
 # ============================================================================
 
+@lru_cache(maxsize=None)
+def _bench_prompt_files():
+    """Map each prompt name to its .txt file in the AMS-IO-Bench subdirectories, scanned once"""
+    prompt_files = {}
+    if not _BENCH_DIR.is_dir():
+        return prompt_files
+    for subdir in _BENCH_DIR.iterdir():
+        if subdir.is_dir() and "golden_output" not in str(subdir):
+            for txt_file in subdir.glob("*.txt"):
+                # First subdirectory wins, as with a per-name search
+                prompt_files.setdefault(txt_file.stem, txt_file)
+    return prompt_files
+
+@lru_cache(maxsize=None)
 def generate_prompt_text(pad_layout_name, prefix="", library_name="LLM_Layout_Design", cell_name=None, view_name="schematic"):
     """
     Generate prompt text from AMS-IO-Bench directory
@@ -461,25 +705,17 @@ def generate_prompt_text(pad_layout_name, prefix="", library_name="LLM_Layout_De
     Returns:
         Formatted prompt string from AMS-IO-Bench file
     """
-    from pathlib import Path
-    import yaml
-    
-    # Get project root
-    project_root = Path(__file__).parent.parent
-    bench_dir = project_root / "AMS-IO-Bench"
-    
-    # Search for the file in all subdirectories
-    prompt_file = None
-    for subdir in bench_dir.iterdir():
-        if subdir.is_dir() and "golden_output" not in str(subdir):
-            candidate_file = subdir / f"{pad_layout_name}.txt"
-            if candidate_file.exists():
-                prompt_file = candidate_file
-                break
+    prompt_file = _bench_prompt_files().get(pad_layout_name)
     
     if not prompt_file:
         raise ValueError(f"Prompt file not found for '{pad_layout_name}' in AMS-IO-Bench directory")
     
+    return _read_prompt_file(prompt_file, pad_layout_name)
+
+def _read_prompt_file(prompt_file, pad_layout_name):
+    """Extract the prompt stored under pad_layout_name from an AMS-IO-Bench file"""
+    import yaml
+    
     # Read file content
     try:
         with open(prompt_file, 'r', encoding='utf-8') as f:
@@ -487,7 +723,7 @@ def generate_prompt_text(pad_layout_name, prefix="", library_name="LLM_Layout_De
         
         # Try to parse as YAML (some files are YAML format with key: |)
         # First, try to find the key in the content
-        lines = content.split('\n')
+        lines = content.splitlines()
         key_line_idx = None
         
         for i, line in enumerate(lines):
@@ -496,8 +732,14 @@ def generate_prompt_text(pad_layout_name, prefix="", library_name="LLM_Layout_De
                 key_line_idx = i
                 break
         
-        # If we found the key line, try YAML parsing
+        # If we found the key line, try YAML parsing. A block body whose first
+        # line is not indented can only fail to parse or come back empty,
+        # so skip the YAML parser in that case
+        body_indented = False
         if key_line_idx is not None:
+            body_line = next((line for line in lines[key_line_idx + 1:] if line.strip()), "")
+            body_indented = body_line[:1].isspace()
+        if body_indented:
             try:
                 yaml_config = yaml.safe_load(content)
                 if yaml_config and isinstance(yaml_config, dict):
@@ -513,39 +755,11 @@ def generate_prompt_text(pad_layout_name, prefix="", library_name="LLM_Layout_De
                 # YAML parsing failed, will try manual parsing below
                 pass
         
-        # If content starts with the key (YAML format but not parsed correctly)
-        # Check if first non-empty line contains the key
-        lines = content.split('\n')
-        key_found = False
-        start_idx = 0
-        
-        for i, line in enumerate(lines):
-            stripped = line.strip()
-            if not stripped:
-                continue
-            # Check if this line contains the key with colon
-            if f"{pad_layout_name}:" in stripped:
-                key_found = True
-                start_idx = i + 1
-                break
-        
-        if key_found and start_idx < len(lines):
-            # Extract content after the key line
-            remaining_lines = lines[start_idx:]
-            # Find minimum indentation (excluding empty lines)
-            min_indent = min(
-                (len(line) - len(line.lstrip()) for line in remaining_lines if line.strip()),
-                default=0
-            )
-            # Remove indentation
-            prompt_lines = []
-            for line in remaining_lines:
-                if line.strip():
-                    # Remove the minimum indentation
-                    prompt_lines.append(line[min_indent:])
-                else:
-                    prompt_lines.append("")
-            result = '\n'.join(prompt_lines).strip()
+        # If content has the key (YAML format but not parsed correctly),
+        # take the lines after the key line found above
+        if key_line_idx is not None and key_line_idx + 1 < len(lines):
+            # Extract content after the key line and remove its common indentation
+            result = textwrap.dedent('\n'.join(lines[key_line_idx + 1:])).strip()
             if result:
                 return result
         
@@ -555,44 +769,35 @@ def generate_prompt_text(pad_layout_name, prefix="", library_name="LLM_Layout_De
     except Exception as e:
         raise ValueError(f"Failed to read prompt file '{prompt_file}': {e}")
 
+@lru_cache(maxsize=None)
 def generate_prompt_key(pad_layout_name, prefix=""):
     """Generate prompt key from pad layout name"""
     if prefix:
         prefix = prefix.rstrip('_') + '_'
     return f"{prefix}io_ring_{pad_layout_name}"
 
+@lru_cache(maxsize=None)
 def get_available_pad_layouts():
-    """Get list of available pad layout names from AMS-IO-Bench directory (28nm only, excluding 180nm)"""
-    from pathlib import Path
-    import yaml
-    
-    # Get project root
-    project_root = Path(__file__).parent.parent
-    bench_dir = project_root / "AMS-IO-Bench"
-    
-    pad_layouts = []
-    
-    if bench_dir.exists() and bench_dir.is_dir():
-        # Search in all subdirectories of AMS-IO-Bench
-        for subdir in bench_dir.iterdir():
-            if subdir.is_dir():
-                # Skip 180nm directories
-                if "180nm" in subdir.name.lower():
-                    continue
-                
-                # Find all .txt files
-                for txt_file in subdir.glob("*.txt"):
-                    # Skip golden_output directory
-                    if "golden_output" in str(txt_file):
-                        continue
-                    
-                    # Extract layout name from filename (without extension)
-                    layout_name = txt_file.stem
-                    pad_layouts.append(layout_name)
-    
-    # Remove duplicates and sort
-    pad_layouts = sorted(set(pad_layouts))
-    return pad_layouts
+    """Get sorted tuple of available pad layout names from AMS-IO-Bench directory (28nm only, excluding 180nm), scanned once"""
+    # Reuse the prompt file index, skipping 180nm directories
+    return tuple(sorted(
+        layout_name
+        for layout_name, prompt_file in _bench_prompt_files().items()
+        if "180nm" not in prompt_file.parent.name.lower()
+    ))
+
+_YAML_HEADER = (
+    "# User Prompt Configuration\n"
+    "# IO Ring pad layout prompts\n"
+    "# Generated automatically from run_io_ring_batch.py\n"
+    "# Use this file to define reusable prompts that can be selected via --prompt key\n"
+    "# Example: python src/main.py --prompt io_ring_3x3_single_ring_digital\n"
+    "\n"
+)
+
+# Start of every line with visible text, and whitespace-only lines
+_YAML_INDENT_RE = re.compile(r"^(?=[^\n]*\S)", re.M)
+_BLANK_LINE_RE = re.compile(r"^[^\S\n]+$", re.M)
 
 def generate_io_ring_yaml(output_file="user_prompt/IO_RING.yaml", prefix="", library_name="LLM_Layout_Design", view_name="schematic"):
     """
@@ -607,45 +812,22 @@ def generate_io_ring_yaml(output_file="user_prompt/IO_RING.yaml", prefix="", lib
     output_path = Path(output_file)
     output_path.parent.mkdir(parents=True, exist_ok=True)
     
-    # Generate YAML content
-    yaml_content = {}
-    yaml_content["# User Prompt Configuration"] = None
-    yaml_content["# IO Ring pad layout prompts"] = None
-    yaml_content["# Generated automatically from run_io_ring_batch.py"] = None
-    yaml_content[""] = None
+    # Write YAML file
+    # We need to write it manually to handle comments and empty lines
+    parts = [_YAML_HEADER]
     
-    # Add each pad layout as a prompt
+    prefix_part = f"{prefix}_" if prefix else ""
     for layout_name in get_available_pad_layouts():
         prompt_key = generate_prompt_key(layout_name, prefix)
-        prompt_text = generate_prompt_text(layout_name, prefix)
-        yaml_content[prompt_key] = prompt_text
-    
-    # Write YAML file
-    # We need to write it manually to handle comments and empty lines
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write("# User Prompt Configuration\n")
-        f.write("# IO Ring pad layout prompts\n")
-        f.write("# Generated automatically from run_io_ring_batch.py\n")
-        f.write("# Use this file to define reusable prompts that can be selected via --prompt key\n")
-        f.write("# Example: python src/main.py --prompt io_ring_3x3_single_ring_digital\n")
-        f.write("\n")
+        # Generate cell name from layout name
+        cell_name = f"{prefix_part}IO_RING_{layout_name}"
+        prompt_text = generate_prompt_text(layout_name, prefix, library_name=library_name, cell_name=cell_name, view_name=view_name)
         
-        for layout_name in get_available_pad_layouts():
-            prompt_key = generate_prompt_key(layout_name, prefix)
-            # Generate cell name from layout name
-            cell_name = f"IO_RING_{layout_name}"
-            if prefix:
-                cell_name = f"{prefix}_{cell_name}"
-            prompt_text = generate_prompt_text(layout_name, prefix, library_name=library_name, cell_name=cell_name, view_name=view_name)
-            
-            f.write(f"{prompt_key}: |\n")
-            # Indent each line of the prompt text
-            for line in prompt_text.split('\n'):
-                if line.strip():  # Only write non-empty lines
-                    f.write(f"  {line}\n")
-                else:
-                    f.write("\n")
-            f.write("\n")
+        # Indent each line of the prompt text, leaving empty lines empty
+        indented = _YAML_INDENT_RE.sub("  ", _BLANK_LINE_RE.sub("", prompt_text))
+        parts.append(f"{prompt_key}: |\n{indented}\n\n")
+    
+    output_path.write_bytes("".join(parts).encode('utf-8'))
     
     print(f"✅ Generated {output_path}")
     print(f"   Total prompts: {len(get_available_pad_layouts())}")
@@ -654,6 +836,300 @@ def generate_io_ring_yaml(output_file="user_prompt/IO_RING.yaml", prefix="", lib
 # ============================================================================
 # Main Function
 # ============================================================================
+def _build_experiments(pad_layouts, prefix):
+    """Build the experiment list for the given pad layouts"""
+    return [
+        {"pad_layout_name": pad_layout_name, "prompt_key": generate_prompt_key(pad_layout_name, prefix)}
+        for pad_layout_name in pad_layouts
+    ]
+
+def _cmd_generate_yaml(prefix):
+    """Handle --generate-yaml"""
+    output_file = Path("user_prompt/IO_RING.yaml")
+    generate_io_ring_yaml(output_file, prefix)
+
+def _cmd_list_layouts(available_layouts):
+    """Handle --list-layouts"""
+    buf = io.StringIO()
+    buf.write("Available pad layout configurations from AMS-IO-Bench:\n")
+    buf.write("=" * 80 + "\n")
+    for i, layout_name in enumerate(available_layouts, 1):
+        buf.write(f"{i:2d}. {layout_name}\n")
+    buf.write(f"\nTotal: {len(available_layouts)} layouts\n")
+    buf.write("=" * 80 + "\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+
+def _cmd_preview(experiments, preview, prefix):
+    """Handle --preview-prompt ('first', 'all' or a pad layout name)"""
+    # Collect the whole preview and write it once
+    lines = ["\n" + "="*80, "PROMPT PREVIEW", "="*80]
+    
+    preview_value = preview.lower() if preview else "first"
+    
+    if preview_value == "first":
+        if experiments:
+            exp = experiments[0]
+            prompt_text = generate_prompt_text(exp["pad_layout_name"], prefix)
+            lines.append(f"\nPad Layout: {exp['pad_layout_name']}")
+            lines.append(f"Prompt Key: {exp['prompt_key']}")
+            lines.append("-"*80)
+            lines.append(prompt_text)
+            lines.append("="*80)
+        else:
+            lines.append("No experiments to preview.")
+    elif preview_value == "all":
+        if experiments:
+            for i, exp in enumerate(experiments, 1):
+                prompt_text = generate_prompt_text(exp["pad_layout_name"], prefix)
+                lines.append(f"\n[{i}/{len(experiments)}] {exp['pad_layout_name']}")
+                lines.append(f"Prompt Key: {exp['prompt_key']}")
+                lines.append("-"*80)
+                lines.append(prompt_text)
+                if i < len(experiments):
+                    lines.append("\n" + "="*80)
+            lines.append("="*80)
+        else:
+            lines.append("No experiments to preview.")
+    else:
+        # Preview specific pad layout; names match case-insensitively like 'first'/'all'
+        exp_by_name = {e["pad_layout_name"].lower(): e for e in experiments}
+        exp = exp_by_name.get(preview_value)
+        if exp is not None:
+            prompt_text = generate_prompt_text(exp["pad_layout_name"], prefix)
+            lines.append(f"\nPad Layout: {exp['pad_layout_name']}")
+            lines.append(f"Prompt Key: {exp['prompt_key']}")
+            lines.append("-"*80)
+            lines.append(prompt_text)
+            lines.append("="*80)
+        else:
+            lines.append(f"Error: Pad layout '{preview}' not found.")
+            lines.append(f"Available layouts: {', '.join(e['pad_layout_name'] for e in experiments)}")
+    
+    text = "\n".join(lines) + "\n"
+    # Prompts can add up to hundreds of KB; encode once and write the bytes
+    # directly. Redirected streams such as io.StringIO have no buffer.
+    out = getattr(sys.stdout, "buffer", None)
+    if out is not None:
+        sys.stdout.flush()
+        out.write(text.encode(sys.stdout.encoding or 'utf-8', errors='replace'))
+        out.flush()
+    else:
+        sys.stdout.write(text)
+        sys.stdout.flush()
+
+def _cmd_run(experiments, args, log_dir):
+    """Run the experiments and write the batch summary"""
+    # Global flag for batch interruption
+    batch_interrupted = threading.Event()
+    # Subprocess reference of every experiment currently running, keyed by index
+    current_processes = {}
+    
+    def kill_running_experiments():
+        for process_ref in list(current_processes.values()):
+            if process_ref['process'] is not None:
+                try:
+                    _kill_process(process_ref['process'])
+                except Exception:
+                    pass
+    
+    def cancel_pending(futures):
+        # Drop experiments still queued behind the running ones
+        for future in futures:
+            future.cancel()
+    
+    # Global signal handler for batch interruption
+    def batch_signal_handler(signum, frame):
+        if not batch_interrupted.is_set():
+            batch_interrupted.set()
+            print(f"\n\n{'='*80}")
+            print(f"[BATCH INTERRUPTED] Received signal {signum}")
+            print(f"Terminating running experiments and stopping batch...")
+            print(f"{'='*80}\n")
+            kill_running_experiments()
+    
+    # Pair every experiment with its index and RAMIC port up front
+    total = len(experiments)
+    port_start = args.ramic_port_start
+    fixed_port = args.ramic_port
+    tasks = [
+        (i, exp, port_start + i - 1 if port_start is not None else fixed_port)
+        for i, exp in enumerate(experiments, 1)
+    ]
+    
+    def run_one(i, exp, ramic_port):
+        """Run experiment number i in a worker thread; returns None if skipped"""
+        if batch_interrupted.is_set():
+            return None
+        
+        prompt_key = exp["prompt_key"]
+        pad_layout_name = exp["pad_layout_name"]
+        
+        # Generate prompt text
+        prompt_text = generate_prompt_text(pad_layout_name, args.prefix)
+        
+        print(f"\n[{i}/{total}] Processing: {prompt_key} ({pad_layout_name})")
+        
+        process_ref = current_processes[i] = {'process': None}
+        try:
+            # Use run_experiment with prompt_text directly
+            return run_experiment(
+                excel_file=None,  # Not used for IO ring
+                sheet_name=pad_layout_name,  # Use pad_layout_name for experiment info
+                prefix=args.prefix,
+                template_type="io_ring",  # Custom type
+                model_name=args.model_name,
+                ramic_port=ramic_port,
+                ramic_host=args.ramic_host,
+                log_dir=log_dir,
+                batch_interrupted_flag=batch_interrupted,
+                current_process_ref=process_ref,
+                prompt_text=prompt_text,  # Pass prompt text directly
+                prompt_key=prompt_key  # Pass prompt key for logging
+            )
+        finally:
+            current_processes.pop(i, None)
+    
+    # Show summary before running
+    print(f"\n{'='*80}")
+    print(f"About to run {len(experiments)} experiments")
+    if args.model_name:
+        print(f"Model: {args.model_name}")
+    if args.concurrency > 1:
+        print(f"Concurrency: {args.concurrency} experiments at a time")
+    print(f"Each experiment will timeout after 50 minutes if not completed")
+    print(f"All experiments will run automatically without user intervention")
+    print(f"{'='*80}")
+    
+    # Register global signal handlers before the countdown so Ctrl+C can cancel it
+    original_sigint = signal.signal(signal.SIGINT, batch_signal_handler)
+    original_sigterm = signal.signal(signal.SIGTERM, batch_signal_handler)
+    
+    # Create log directory once for the whole batch
+    os.makedirs(log_dir, exist_ok=True)
+    
+    # Give an interactive user a moment to abort; nobody is watching a
+    # redirected or CI run, so start right away there
+    if sys.stdout.isatty():
+        print("Starting batch execution in 3 seconds...")
+        batch_interrupted.wait(3)
+    else:
+        print("Starting batch execution...")
+    
+    # Run experiments
+    results = []
+    successful = 0
+    total_start_time = time.monotonic()
+    
+    print(f"Press Ctrl+C once to stop the entire batch immediately")
+    
+    try:
+        # Experiments are independent and spend their time waiting on the
+        # agent subprocess, so a thread per concurrent experiment is enough
+        with ThreadPoolExecutor(max_workers=args.concurrency) as executor:
+            futures = {executor.submit(run_one, *task): task[0] for task in tasks}
+            try:
+                for future in as_completed(futures):
+                    result = future.result()
+                    if result is None:
+                        continue
+                    results.append((futures[future], result))
+                    if result["success"]:
+                        successful += 1
+                    
+                    if batch_interrupted.is_set():
+                        cancel_pending(futures)
+                        continue
+                    
+                    if not result["success"]:
+                        prompt_key = result["prompt_key"]
+                        is_timeout = result.get("error", "").startswith("Experiment timed out")
+                        if is_timeout:
+                            print(f"\n⚠️  Experiment '{prompt_key}' timed out after 50 minutes, automatically continuing...")
+                        else:
+                            print(f"\n⚠️  Experiment '{prompt_key}' failed: {result.get('error', 'Unknown error')}")
+                            print(f"Automatically continuing to next experiment...")
+            except BaseException:
+                # Do not start queued experiments or wait on running ones
+                batch_interrupted.set()
+                cancel_pending(futures)
+                kill_running_experiments()
+                raise
+        
+        if batch_interrupted.is_set():
+            print(f"\n[BATCH STOPPED] Stopping batch execution after {len(results)} experiments")
+    except KeyboardInterrupt:
+        print(f"\n[BATCH INTERRUPTED] Stopping batch execution...")
+    finally:
+        signal.signal(signal.SIGINT, original_sigint)
+        signal.signal(signal.SIGTERM, original_sigterm)
+    
+    # Report results in experiment order rather than completion order
+    results = [result for _, result in sorted(results, key=lambda item: item[0])]
+    
+    # Print summary
+    total_time = time.monotonic() - total_start_time
+    failed = len(results) - successful
+    
+    # Per-result lines shared by the console summary and the summary file
+    status_lines = []
+    for result in results:
+        status = "✓" if result["success"] else "✗"
+        line = f"  {status} {result['prompt_key']} ({result['elapsed_time']/60:.2f} min)"
+        if not result["success"] and result["error"]:
+            line += f"\n      Error: {result['error']}"
+        status_lines.append(line)
+    
+    buf = io.StringIO()
+    w = buf.write
+    w(f"\n{'='*80}\n")
+    if batch_interrupted.is_set():
+        w("BATCH EXPERIMENT SUMMARY (INTERRUPTED)\n")
+    else:
+        w("BATCH EXPERIMENT SUMMARY\n")
+    w(f"{'='*80}\n")
+    w(f"Total experiments completed: {len(results)}/{len(experiments)}\n")
+    if batch_interrupted.is_set():
+        w(f"Remaining experiments: {len(experiments) - len(results)}\n")
+    w(f"Successful: {successful}\n")
+    w(f"Failed: {failed}\n")
+    w(f"Total time: {total_time/3600:.2f} hours ({total_time/60:.2f} minutes)\n")
+    w("\nResults:\n")
+    for line in status_lines:
+        w(line + "\n")
+    
+    if batch_interrupted.is_set() and len(results) < len(experiments):
+        w("\nInterrupted experiments (not run):\n")
+        completed_keys = {r["prompt_key"] for r in results}
+        for exp in experiments:
+            if exp["prompt_key"] not in completed_keys:
+                w(f"  - {exp['prompt_key']}\n")
+    
+    w(f"{'='*80}\n\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
+    
+    # Save summary to file
+    summary_file = os.path.join(log_dir, f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
+    summary_parts = [
+        "BATCH EXPERIMENT SUMMARY\n",
+        "="*80 + "\n",
+        f"Experiment type: IO Ring pad layouts\n",
+        f"Total experiments: {len(results)}/{len(experiments)}\n",
+        f"Successful: {successful}\n",
+        f"Failed: {failed}\n",
+        f"Total time: {total_time/3600:.2f} hours ({total_time/60:.2f} minutes)\n\n",
+        "Results:\n",
+    ]
+    for line, result in zip(status_lines, results):
+        summary_parts.append(f"{line}\n      Log: {result['log_file']}\n")
+    # Write next to the target and rename, so a killed batch never leaves a truncated summary
+    tmp_file = summary_file + ".tmp"
+    with open(tmp_file, 'w', encoding='utf-8') as f:
+        f.write("".join(summary_parts))
+    os.replace(tmp_file, summary_file)
+    
+    print(f"Summary saved to: {summary_file}")
 
 def main():
     """Main function to run IO ring batch experiments"""
@@ -734,6 +1210,13 @@ Examples:
         default=None,
         help="RAMIC bridge port (used for all experiments if --ramic-port-start is not specified)"
     )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="Number of experiments to run at the same time (default: 1). "
+             "Use with --ramic-port-start so each experiment gets its own RAMIC port."
+    )
     parser.add_argument(
         "--list-layouts",
         action="store_true",
@@ -747,21 +1230,24 @@ Examples:
     
     args = parser.parse_args()
     
+    if args.concurrency < 1:
+        print(f"Error: --concurrency must be >= 1 (got {args.concurrency})")
+        return
+    if args.concurrency > 1 and args.ramic_port_start is None:
+        print("Error: --concurrency > 1 requires --ramic-port-start so each experiment gets its own RAMIC port")
+        return
+    
     # Generate YAML file if requested
     if args.generate_yaml:
-        output_file = Path("user_prompt/IO_RING.yaml")
-        generate_io_ring_yaml(output_file, args.prefix)
+        _cmd_generate_yaml(args.prefix)
         return
     
+    # Pad layouts available in AMS-IO-Bench, shared by every command below
+    available_layouts = get_available_pad_layouts()
+    
     # List layouts if requested
     if args.list_layouts:
-        print("Available pad layout configurations from AMS-IO-Bench:")
-        print("=" * 80)
-        available_layouts = get_available_pad_layouts()
-        for i, layout_name in enumerate(available_layouts, 1):
-            print(f"{i:2d}. {layout_name}")
-        print(f"\nTotal: {len(available_layouts)} layouts")
-        print("=" * 80)
+        _cmd_list_layouts(available_layouts)
         
         # If preview is also requested, continue to preview section
         if not args.preview_prompt:
@@ -774,8 +1260,6 @@ Examples:
         log_dir = "logs/batch_io_ring"
     
     # Generate experiment list from AMS-IO-Bench directory
-    available_layouts = get_available_pad_layouts()
-    
     if args.pad_layout:
         if args.pad_layout not in available_layouts:
             print(f"Error: Unknown pad layout '{args.pad_layout}'")
@@ -786,13 +1270,9 @@ Examples:
         pad_layouts = available_layouts
     
     # Generate experiments
-    experiments = []
-    for pad_layout_name in pad_layouts:
-        prompt_key = generate_prompt_key(pad_layout_name, args.prefix)
-        experiments.append({
-            "pad_layout_name": pad_layout_name,
-            "prompt_key": prompt_key
-        })
+    experiments = _build_experiments(pad_layouts, args.prefix)
+    # --list-layouts with --preview-prompt previews and runs every layout, not just the index range
+    all_experiments = experiments
     
     print(f"Generated {len(experiments)} IO ring experiments:")
     if args.prefix:
@@ -800,8 +1280,11 @@ Examples:
     if args.model_name:
         print(f"Using model: '{args.model_name}'")
     print(f"Log directory: {log_dir}")
+    buf = io.StringIO()
     for i, exp in enumerate(experiments, 1):
-        print(f"  {i}. {exp['pad_layout_name']} -> {exp['prompt_key']}")
+        buf.write(f"  {i}. {exp['pad_layout_name']} -> {exp['prompt_key']}\n")
+    sys.stdout.write(buf.getvalue())
+    sys.stdout.flush()
     
     # Filter by start/stop index
     if args.start_index is not None:
@@ -823,224 +1306,25 @@ Examples:
             print(f"Stopping at experiment index: {args.stop_index}")
     
     if args.dry_run:
-        print("\n[DRY RUN] Would run the following experiments:")
+        buf = io.StringIO()
+        buf.write("\n[DRY RUN] Would run the following experiments:\n")
         for exp in experiments:
-            print(f"  - {exp['pad_layout_name']} -> {exp['prompt_key']}")
+            buf.write(f"  - {exp['pad_layout_name']} -> {exp['prompt_key']}\n")
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         return
     
     if args.preview_prompt:
-        # If we only have list_layouts, we need to generate experiments list first
         if args.list_layouts and not args.pad_layout:
-            # Generate all experiments for preview
-            pad_layouts = get_available_pad_layouts()
-            experiments = []
-            for pad_layout_name in pad_layouts:
-                prompt_key = generate_prompt_key(pad_layout_name, args.prefix)
-                experiments.append({
-                    "pad_layout_name": pad_layout_name,
-                    "prompt_key": prompt_key
-                })
-        
-        print("\n" + "="*80)
-        print("PROMPT PREVIEW")
-        print("="*80)
-        
-        preview_value = args.preview_prompt.lower() if args.preview_prompt else "first"
-        
-        if preview_value == "first":
-            if experiments:
-                exp = experiments[0]
-                prompt_text = generate_prompt_text(exp["pad_layout_name"], args.prefix)
-                print(f"\nPad Layout: {exp['pad_layout_name']}")
-                print(f"Prompt Key: {exp['prompt_key']}")
-                print("-"*80)
-                print(prompt_text)
-                print("="*80)
-            else:
-                print("No experiments to preview.")
-        elif preview_value == "all":
-            if experiments:
-                for i, exp in enumerate(experiments, 1):
-                    prompt_text = generate_prompt_text(exp["pad_layout_name"], args.prefix)
-                    print(f"\n[{i}/{len(experiments)}] {exp['pad_layout_name']}")
-                    print(f"Prompt Key: {exp['prompt_key']}")
-                    print("-"*80)
-                    print(prompt_text)
-                    if i < len(experiments):
-                        print("\n" + "="*80)
-                print("="*80)
-            else:
-                print("No experiments to preview.")
-        else:
-            # Preview specific pad layout
-            found = False
-            for exp in experiments:
-                if exp["pad_layout_name"] == args.preview_prompt:
-                    prompt_text = generate_prompt_text(exp["pad_layout_name"], args.prefix)
-                    print(f"\nPad Layout: {exp['pad_layout_name']}")
-                    print(f"Prompt Key: {exp['prompt_key']}")
-                    print("-"*80)
-                    print(prompt_text)
-                    print("="*80)
-                    found = True
-                    break
-            if not found:
-                print(f"Error: Pad layout '{args.preview_prompt}' not found.")
-                print(f"Available layouts: {', '.join([e['pad_layout_name'] for e in experiments])}")
+            # With --list-layouts, preview and run cover every layout
+            experiments = all_experiments
+        _cmd_preview(experiments, args.preview_prompt, args.prefix)
         
         # If only preview was requested (not list_layouts), return here
         if not args.list_layouts:
             return
     
-    # Show summary before running
-    print(f"\n{'='*80}")
-    print(f"About to run {len(experiments)} experiments")
-    if args.model_name:
-        print(f"Model: {args.model_name}")
-    print(f"Each experiment will timeout after 50 minutes if not completed")
-    print(f"All experiments will run automatically without user intervention")
-    print(f"{'='*80}")
-    print("Starting batch execution in 3 seconds...")
-    time.sleep(3)
-    
-    # Global flag for batch interruption
-    batch_interrupted = {'flag': False}
-    current_process = {'process': None}
-    
-    # Global signal handler for batch interruption
-    def batch_signal_handler(signum, frame):
-        if not batch_interrupted['flag']:
-            batch_interrupted['flag'] = True
-            print(f"\n\n{'='*80}")
-            print(f"[BATCH INTERRUPTED] Received signal {signum}")
-            print(f"Terminating current experiment and stopping batch...")
-            print(f"{'='*80}\n")
-            if current_process['process'] is not None:
-                try:
-                    if sys.platform.startswith('win'):
-                        current_process['process'].kill()
-                    else:
-                        os.killpg(os.getpgid(current_process['process'].pid), signal.SIGKILL)
-                except Exception:
-                    pass
-    
-    # Register global signal handlers
-    original_sigint = signal.signal(signal.SIGINT, batch_signal_handler)
-    original_sigterm = signal.signal(signal.SIGTERM, batch_signal_handler)
-    
-    # Run experiments
-    results = []
-    total_start_time = time.time()
-    
-    print(f"Press Ctrl+C once to stop the entire batch immediately")
-    
-    try:
-        for i, exp in enumerate(experiments, 1):
-            if batch_interrupted['flag']:
-                print(f"\n[BATCH STOPPED] Stopping batch execution after {len(results)} experiments")
-                break
-            
-            prompt_key = exp["prompt_key"]
-            pad_layout_name = exp["pad_layout_name"]
-            
-            # Generate prompt text
-            prompt_text = generate_prompt_text(pad_layout_name, args.prefix)
-            
-            # Determine RAMIC port
-            ramic_port = None
-            if args.ramic_port_start is not None:
-                ramic_port = args.ramic_port_start + (i - 1)
-            elif args.ramic_port is not None:
-                ramic_port = args.ramic_port
-            
-            print(f"\n[{i}/{len(experiments)}] Processing: {prompt_key} ({pad_layout_name})")
-            
-            # Use run_experiment with prompt_text directly
-            result = run_experiment(
-                excel_file=None,  # Not used for IO ring
-                sheet_name=pad_layout_name,  # Use pad_layout_name for experiment info
-                prefix=args.prefix,
-                template_type="io_ring",  # Custom type
-                model_name=args.model_name,
-                ramic_port=ramic_port,
-                ramic_host=args.ramic_host,
-                log_dir=log_dir,
-                batch_interrupted_flag=batch_interrupted,
-                current_process_ref=current_process,
-                prompt_text=prompt_text,  # Pass prompt text directly
-                prompt_key=prompt_key  # Pass prompt key for logging
-            )
-            results.append(result)
-            
-            if batch_interrupted['flag']:
-                print(f"\n[BATCH STOPPED] Stopping batch execution after {len(results)} experiments")
-                break
-            
-            if not result["success"]:
-                is_timeout = result.get("error", "").startswith("Experiment timed out")
-                if is_timeout:
-                    print(f"\n⚠️  Experiment '{prompt_key}' timed out after 50 minutes, automatically continuing...")
-                else:
-                    print(f"\n⚠️  Experiment '{prompt_key}' failed: {result.get('error', 'Unknown error')}")
-                    print(f"Automatically continuing to next experiment...")
-    except KeyboardInterrupt:
-        batch_interrupted['flag'] = True
-        print(f"\n[BATCH INTERRUPTED] Stopping batch execution...")
-    finally:
-        signal.signal(signal.SIGINT, original_sigint)
-        signal.signal(signal.SIGTERM, original_sigterm)
-    
-    # Print summary
-    total_time = time.time() - total_start_time
-    successful = sum(1 for r in results if r["success"])
-    failed = len(results) - successful
-    
-    print(f"\n{'='*80}")
-    if batch_interrupted['flag']:
-        print("BATCH EXPERIMENT SUMMARY (INTERRUPTED)")
-    else:
-        print("BATCH EXPERIMENT SUMMARY")
-    print(f"{'='*80}")
-    print(f"Total experiments completed: {len(results)}/{len(experiments)}")
-    if batch_interrupted['flag']:
-        print(f"Remaining experiments: {len(experiments) - len(results)}")
-    print(f"Successful: {successful}")
-    print(f"Failed: {failed}")
-    print(f"Total time: {total_time/3600:.2f} hours ({total_time/60:.2f} minutes)")
-    print(f"\nResults:")
-    for result in results:
-        status = "✓" if result["success"] else "✗"
-        print(f"  {status} {result['prompt_key']} ({result['elapsed_time']/60:.2f} min)")
-        if not result["success"] and result["error"]:
-            print(f"      Error: {result['error']}")
-    
-    if batch_interrupted['flag'] and len(results) < len(experiments):
-        print(f"\nInterrupted experiments (not run):")
-        for exp in experiments[len(results):]:
-            print(f"  - {exp['prompt_key']}")
-    
-    print(f"{'='*80}\n")
-    
-    # Save summary to file
-    summary_file = os.path.join(log_dir, f"summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt")
-    os.makedirs(log_dir, exist_ok=True)
-    with open(summary_file, 'w', encoding='utf-8') as f:
-        f.write("BATCH EXPERIMENT SUMMARY\n")
-        f.write("="*80 + "\n")
-        f.write(f"Experiment type: IO Ring pad layouts\n")
-        f.write(f"Total experiments: {len(results)}/{len(experiments)}\n")
-        f.write(f"Successful: {successful}\n")
-        f.write(f"Failed: {failed}\n")
-        f.write(f"Total time: {total_time/3600:.2f} hours ({total_time/60:.2f} minutes)\n\n")
-        f.write("Results:\n")
-        for result in results:
-            status = "✓" if result["success"] else "✗"
-            f.write(f"  {status} {result['prompt_key']} ({result['elapsed_time']/60:.2f} min)\n")
-            if not result["success"] and result["error"]:
-                f.write(f"      Error: {result['error']}\n")
-            f.write(f"      Log: {result['log_file']}\n")
-    
-    print(f"Summary saved to: {summary_file}")
+    _cmd_run(experiments, args, log_dir)
 
 if __name__ == "__main__":
     main()
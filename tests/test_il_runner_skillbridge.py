@@ -12,26 +12,65 @@ It requires Cadence Virtuoso to be running and skillbridge library installed.
 import sys
 from pathlib import Path
 
-def run_il_file(il_file_path):
+# Workspace shared by every IL run in this process (opened on first use)
+_WS = None
+
+def _get_ws():
+    """Return the shared skillbridge workspace, opening it if needed"""
+    global _WS
+    if _WS is None:
+        # Import skillbridge
+        from skillbridge import Workspace
+        _WS = Workspace.open()
+    return _WS
+
+def _close_ws():
+    """Close the shared skillbridge workspace if it is open"""
+    global _WS
+    if _WS is not None:
+        ws, _WS = _WS, None
+        ws.close()
+
+def _load_and_save(ws, il_file_paths, save):
+    """Load the IL files (and save the edit cellview) in one SKILL round trip"""
+    exprs = []
+    for il_file_path in il_file_paths:
+        escaped_path = str(il_file_path).replace('\\', '\\\\').replace('"', '\\"')
+        exprs.append(f'load("{escaped_path}")')
+    if save:
+        exprs.append('dbSave(geGetEditCellView())')
+    ws['evalstring'](f"progn({' '.join(exprs)})")
+
+def run_il_file(il_file_path, save=True):
     """
     Run IL file
     
     Args:
         il_file_path: IL file path
+        save: Save the edited cellview afterwards; pass False for read-only IL
     """
-    # Import skillbridge
-    from skillbridge import Workspace
-    
-    # Open workspace and execute
+    # Reuse the open workspace instead of reconnecting per file
     print(f"🔄 Running IL file: {Path(il_file_path).name}")
-    ws = Workspace.open()
+    ws = _get_ws()
     
     # Load and execute IL file
-    ws['load'](il_file_path)
-    cv = ws['geGetEditCellView']()
-    ws['dbSave'](cv)
+    _load_and_save(ws, [il_file_path], save)
     print(f"✅ IL file {Path(il_file_path).name} executed successfully")
-    ws.close()
+    return True
+
+def run_il_files(il_file_paths, save=True):
+    """
+    Run several IL files, saving the edited cellview once at the end
+    
+    Args:
+        il_file_paths: IL file paths, loaded in order
+        save: Save the edited cellview afterwards; pass False for read-only IL
+    """
+    ws = _get_ws()
+    for il_file_path in il_file_paths:
+        print(f"🔄 Running IL file: {Path(il_file_path).name}")
+    _load_and_save(ws, il_file_paths, save)
+    print(f"✅ {len(il_file_paths)} IL files executed successfully")
     return True
 
 def test_run_il_file():
@@ -48,10 +87,9 @@ def test_run_il_file():
     if len(sys.argv) < 2:
         pytest.skip("No IL file provided for testing")
     
-    # Try to connect to Virtuoso, skip if connection fails
+    # Try to connect to Virtuoso, skip if connection fails; the connection is kept for the run
     try:
-        ws = Workspace.open()
-        ws.close()
+        _get_ws()
     except (PermissionError, ConnectionError, Exception) as e:
         pytest.skip(f"Cannot connect to Virtuoso: {e}. This is expected if Virtuoso is not running or skillbridge server is not loaded.")
     
@@ -61,16 +99,26 @@ def test_run_il_file():
         assert success, "run_il_file should return True on success"
     except (PermissionError, ConnectionError) as e:
         pytest.skip(f"Cannot execute IL file due to connection issue: {e}. This is expected if Virtuoso is not running or skillbridge server is not loaded.")
+    finally:
+        _close_ws()
 
 def main():
     """Main function"""
-    if len(sys.argv) != 2:
-        print("Usage: python simple_il_runner.py <il_file_path>")
+    # --no-save skips dbSave for IL that only reads or prints
+    save = "--no-save" not in sys.argv[1:]
+    il_file_paths = [arg for arg in sys.argv[1:] if arg != "--no-save"]
+    if not il_file_paths:
+        print("Usage: python simple_il_runner.py [--no-save] <il_file_path> [<il_file_path> ...]")
         print("Example: python simple_il_runner.py output/test.il")
         sys.exit(1)
     
-    il_file_path = sys.argv[1]
-    success = run_il_file(il_file_path)
+    try:
+        if len(il_file_paths) == 1:
+            success = run_il_file(il_file_paths[0], save=save)
+        else:
+            success = run_il_files(il_file_paths, save=save)
+    finally:
+        _close_ws()
     
     if success:
         print("[Program execution completed]")
@@ -15,16 +15,71 @@ Options:
     -q, --quiet        Quiet mode
 """
 
+import os
+import re
 import sys
-import argparse
-import json
 from pathlib import Path
 from datetime import datetime
+from functools import lru_cache
 
 # Add project root directory to Python path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from src.tools.il_runner_tool import run_il_file, list_il_files, run_il_with_screenshot, clear_all_figures_in_window, screenshot_current_window
+# The IL runner tools pull in the agent and bridge stack, so each function
+# imports what it needs; listing files and --help stay lightweight
+
+# Name of the per-run output directories, e.g. 20250101_120000
+TS_RE = re.compile(r"^[0-9]{8}_[0-9]{6}$")
+
+def _iter_dirs(root):
+    """Recursively yield every directory below root (files are never stat'ed)"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield entry
+                yield from _iter_dirs(entry.path)
+
+def _find_il_files(root):
+    """Recursively find .il and .skill files below root in a single walk, as os.DirEntry objects"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _find_il_files(entry.path)
+            elif entry.name.endswith(('.il', '.skill')):
+                yield entry
+
+def extract_timestamp(file_path, entry=None):
+    """Timestamp of an IL file, from its run directory name or else its mtime
+    
+    entry is the file's os.DirEntry when known; its stat() result is cached.
+    """
+    # Try to extract timestamp from parent directory name
+    dir_name = file_path.parent.name
+    if TS_RE.match(dir_name):
+        try:
+            return datetime.strptime(dir_name, "%Y%m%d_%H%M%S")
+        except ValueError:
+            pass
+    # If not in timestamp directory, use file modification time
+    st = entry.stat() if entry is not None else file_path.stat()
+    return datetime.fromtimestamp(st.st_mtime)
+
+def _il_files_with_time(root):
+    """(path, timestamp) of every IL file below root, newest first"""
+    files_with_time = []
+    for entry in _find_il_files(root):
+        file_path = Path(entry.path)
+        files_with_time.append((file_path, extract_timestamp(file_path, entry)))
+    files_with_time.sort(key=lambda x: x[1], reverse=True)
+    return files_with_time
 
 def find_latest_il_file():
     """Find the latest IL file"""
@@ -32,24 +87,21 @@ def find_latest_il_file():
     
     # Recursively find all timestamp directories
     timestamp_dirs = []
-    if dir_path.exists():
-        # Recursively search for all directories that match timestamp format
-        for item in dir_path.rglob("*"):
-            if item.is_dir() and item.name.replace('_', '').isdigit():
-                # Check if it's a timestamp format directory
-                try:
-                    datetime.strptime(item.name, "%Y%m%d_%H%M%S")
-                    timestamp_dirs.append(item)
-                except ValueError:
-                    continue
+    for entry in _iter_dirs(dir_path):
+        # Only names shaped like a timestamp are worth parsing
+        if TS_RE.match(entry.name):
+            try:
+                datetime.strptime(entry.name, "%Y%m%d_%H%M%S")
+                timestamp_dirs.append(Path(entry.path))
+            except ValueError:
+                continue
     
     if not timestamp_dirs:
         print("   ⚠️  No timestamp directories found")
         return None
     
-    # Sort by timestamp, get the latest directory
-    timestamp_dirs.sort(key=lambda x: datetime.strptime(x.name, "%Y%m%d_%H%M%S"))
-    latest_dir = timestamp_dirs[-1]
+    # Get the latest directory; fixed-width YYYYMMDD_HHMMSS names sort chronologically
+    latest_dir = max(timestamp_dirs, key=lambda x: x.name)
     
     # Find IL files in the latest directory
     il_files = list(latest_dir.glob("*.il")) + list(latest_dir.glob("*.skill"))
@@ -61,44 +113,35 @@ def find_latest_il_file():
     # Return the latest IL file
     return il_files[0]  # Usually there's only one IL file per directory
 
+def _format_file_entry(number, file_path, timestamp, dir_path):
+    """One numbered line of an IL file listing"""
+    # Show relative path from output directory
+    try:
+        shown_path = file_path.relative_to(dir_path)
+    except ValueError:
+        shown_path = file_path
+    return f"{number}. {shown_path} (Created: {timestamp.strftime('%Y-%m-%d %H:%M:%S')})"
+
 def list_all_files(quiet=False):
     """List all IL files recursively"""
     if not quiet:
         print("\n1. Listing all IL files (recursively)...")
     
     dir_path = Path("output")
-    all_il_files = []
     
-    # Recursively find all IL files in the output directory
-    if dir_path.exists():
-        il_files = list(dir_path.rglob("*.il")) + list(dir_path.rglob("*.skill"))
-        all_il_files.extend(il_files)
+    # Recursively find all IL files in the output directory, sorted by timestamp
+    files_with_time = _il_files_with_time(dir_path)
     
-    if not all_il_files:
+    if not files_with_time:
         print("   ⚠️  No IL files found")
         return False
     
-    # Sort by timestamp
-    def extract_timestamp(file_path):
-        # Try to extract timestamp from parent directory name
-        dir_name = file_path.parent.name
-        try:
-            return datetime.strptime(dir_name, "%Y%m%d_%H%M%S")
-        except ValueError:
-            # If not in timestamp directory, use file modification time
-            return datetime.fromtimestamp(file_path.stat().st_mtime)
-    
-    all_il_files.sort(key=extract_timestamp, reverse=True)
-    
-    print(f"   📁 Found {len(all_il_files)} IL files:")
-    for i, file_path in enumerate(all_il_files, 1):
-        timestamp = extract_timestamp(file_path)
-        # Show relative path from output directory
-        try:
-            rel_path = file_path.relative_to(dir_path)
-            print(f"   {i}. {rel_path} (Created: {timestamp.strftime('%Y-%m-%d %H:%M:%S')})")
-        except ValueError:
-            print(f"   {i}. {file_path} (Created: {timestamp.strftime('%Y-%m-%d %H:%M:%S')})")
+    # Build the whole listing and write it once
+    lines = [f"   📁 Found {len(files_with_time)} IL files:"]
+    for i, (file_path, timestamp) in enumerate(files_with_time, 1):
+        lines.append(f"   {_format_file_entry(i, file_path, timestamp, dir_path)}")
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
     
     return True
 
@@ -107,12 +150,14 @@ def test_list_all_files():
     result = list_all_files(quiet=True)
     assert isinstance(result, bool), "list_all_files should return a boolean"
 
-def run_latest_file(quiet=False, lib=None, cell=None, view="layout"):
-    """Run the latest IL file"""
+def run_latest_file(quiet=False, lib=None, cell=None, view="layout", latest_file=None):
+    """Run the latest IL file (latest_file skips the search when already known)"""
+    from src.tools.il_runner_tool import run_il_file
     if not quiet:
         print("\n2. Running the latest IL file...")
     try:
-        latest_file = find_latest_il_file()
+        if latest_file is None:
+            latest_file = find_latest_il_file()
         
         if latest_file:
             if not quiet:
@@ -142,27 +187,25 @@ def test_run_latest_file():
     except Exception as e:
         pytest.skip(f"run_latest_file requires IL files and Virtuoso: {e}")
 
-def run_latest_file_with_screenshot(quiet=False, lib=None, cell=None, view="layout"):
-    """Run the latest IL file and save screenshot"""
+def run_latest_file_with_screenshot(quiet=False, lib=None, cell=None, view="layout", latest_file=None):
+    """Run the latest IL file and save screenshot (latest_file skips the search when already known)"""
+    from src.tools.il_runner_tool import run_il_with_screenshot_obj
     if not quiet:
         print("\n3. Running the latest IL file and saving screenshot...")
     try:
-        latest_file = find_latest_il_file()
+        if latest_file is None:
+            latest_file = find_latest_il_file()
         
         if latest_file:
             if not quiet:
                 print(f"   📄  Running latest file: {latest_file.parent.name}/{latest_file.name}")
+            # Use the dict result directly rather than a JSON round trip
+            # Observations are only printed outside quiet mode
             if lib and cell:
-                result = run_il_with_screenshot(str(latest_file), lib=lib, cell=cell, view=view)
+                result_data = run_il_with_screenshot_obj(str(latest_file), lib=lib, cell=cell, view=view, collect_observations=not quiet)
             else:
                 # Use default values when lib and cell are not provided
-                result = run_il_with_screenshot(str(latest_file), lib="TestLib", cell="TestCell", view=view)
-            
-            # Parse JSON result
-            if not isinstance(result, str):
-                print("   ❌  Incorrect result type")
-                return False
-            result_data = json.loads(result)
+                result_data = run_il_with_screenshot_obj(str(latest_file), lib="TestLib", cell="TestCell", view=view, collect_observations=not quiet)
             
             # Print execution status
             status_emoji = "✅" if result_data["status"] == "success" else "❌"
@@ -189,6 +232,7 @@ def run_latest_file_with_screenshot(quiet=False, lib=None, cell=None, view="layo
 
 def run_selected_file(file_path, quiet=False, lib=None, cell=None, view="layout"):
     """Run the selected IL file"""
+    from src.tools.il_runner_tool import run_il_file
     if not quiet:
         print(f"\n   📄  Running selected file: {Path(file_path).name}")
     if lib and cell:
@@ -199,51 +243,49 @@ def run_selected_file(file_path, quiet=False, lib=None, cell=None, view="layout"
     print(f"   🚀 {result}")
     return True
 
+# Number of files listed at a time in interactive selection
+PAGE_SIZE = 20
+
+def _print_file_page(files_with_time, dir_path, start):
+    """Print the next page of the file list; returns how many files are shown in total"""
+    end = min(start + PAGE_SIZE, len(files_with_time))
+    lines = [
+        _format_file_entry(idx + 1, file, timestamp, dir_path)
+        for idx, (file, timestamp) in enumerate(files_with_time[start:end], start)
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
+    sys.stdout.flush()
+    return end
+
 def interactive_select_and_run(quiet=False):
     """Interactive selection and run IL file"""
     if not quiet:
         print("\nSelect IL file to run...")
     try:
         dir_path = Path("output")
-        all_il_files = []
         
-        # Recursively find all IL files in the output directory
-        if dir_path.exists():
-            il_files = list(dir_path.rglob("*.il")) + list(dir_path.rglob("*.skill"))
-            all_il_files.extend(il_files)
+        # Recursively find all IL files in the output directory, sorted by timestamp
+        files_with_time = _il_files_with_time(dir_path)
         
-        if not all_il_files:
+        if not files_with_time:
             print("   ⚠️  No IL files found")
             return False
-            
-        # Extract timestamp and sort
-        def extract_timestamp(file_path):
-            # Try to extract timestamp from parent directory name
-            dir_name = file_path.parent.name
-            try:
-                return datetime.strptime(dir_name, "%Y%m%d_%H%M%S")
-            except ValueError:
-                # If not in timestamp directory, use file modification time
-                return datetime.fromtimestamp(file_path.stat().st_mtime)
         
-        # Sort by timestamp
-        files_with_time = [(f, extract_timestamp(f)) for f in all_il_files]
-        files_with_time.sort(key=lambda x: x[1], reverse=True)
-        
-        # Display file list
+        # Display the first page of the file list; more pages on request
         print("\nAvailable IL files:")
-        for idx, (file, timestamp) in enumerate(files_with_time, 1):
-            # Show relative path from output directory
-            try:
-                rel_path = file.relative_to(dir_path)
-                print(f"{idx}. {rel_path} (Created: {timestamp.strftime('%Y-%m-%d %H:%M:%S')})")
-            except ValueError:
-                print(f"{idx}. {file} (Created: {timestamp.strftime('%Y-%m-%d %H:%M:%S')})")
+        shown = _print_file_page(files_with_time, dir_path, 0)
         
         # Get user choice
         while True:
             try:
-                choice = input("\nPlease select the file number to run (1-{0}): ".format(len(files_with_time)))
+                if shown < len(files_with_time):
+                    prompt = "\nPlease select the file number to run (1-{0}), or 'm' to show more: "
+                else:
+                    prompt = "\nPlease select the file number to run (1-{0}): "
+                choice = input(prompt.format(len(files_with_time))).strip()
+                if choice.lower() in ('m', 'more') and shown < len(files_with_time):
+                    shown = _print_file_page(files_with_time, dir_path, shown)
+                    continue
                 idx = int(choice) - 1
                 if 0 <= idx < len(files_with_time):
                     selected_file = files_with_time[idx][0]
@@ -262,6 +304,7 @@ def interactive_select_and_run(quiet=False):
 
 def clear_figures_in_window(quiet=False):
     """Clear all components in the current window"""
+    from src.tools.il_runner_tool import clear_all_figures_in_window
     if not quiet:
         print("\n  Clearing all components in the current window...")
     try:
@@ -286,14 +329,11 @@ def test_clear_figures_in_window():
 
 def screenshot_window_only(quiet=False):
     """Take a screenshot of the current Virtuoso window only, without running IL file"""
+    from src.tools.il_runner_tool import screenshot_current_window_obj
     if not quiet:
         print("\n4. Taking screenshot of the current Virtuoso window only...")
     try:
-        result = screenshot_current_window()
-        if not isinstance(result, str):
-            print("   ❌  Incorrect result type")
-            return False
-        result_data = json.loads(result)
+        result_data = screenshot_current_window_obj()
         status_emoji = "✅" if result_data["status"] == "success" else "❌"
         print(f"   {status_emoji} {result_data['message']}")
         if result_data["screenshot_path"]:
@@ -303,8 +343,11 @@ def screenshot_window_only(quiet=False):
         print(f"   ❌  Error occurred while taking screenshot: {e}")
         return False
 
-def main():
-    """Main function, handles command line arguments and executes corresponding operations"""
+@lru_cache(maxsize=None)
+def _build_parser():
+    """Build the command line parser once; repeated main() calls reuse it"""
+    import argparse
+    
     parser = argparse.ArgumentParser(description="IL File System Test Program")
     parser.add_argument('-l', '--list', action='store_true', help='List all IL files')
     parser.add_argument('-r', '--run', action='store_true', help='Run the latest IL file')
@@ -317,8 +360,11 @@ def main():
     parser.add_argument('--lib', dest='lib', default=None, help='Target library name to run on (optional)')
     parser.add_argument('--cell', dest='cell', default=None, help='Target cell name to run on (optional)')
     parser.add_argument('--view', dest='view', default='layout', help='Target view name (default: layout)')
-    
-    args = parser.parse_args()
+    return parser
+
+def main(argv=None):
+    """Main function, handles command line arguments and executes corresponding operations"""
+    args = _build_parser().parse_args(argv)
 
     # If only clear, execute and return
     if args.clear:
@@ -355,13 +401,18 @@ def main():
         success = interactive_select_and_run(args.quiet) and success
         return 0 if success else 1
 
+    # Both steps below use the same latest file; search output/ only once
+    latest_file = None
+    if (args.run or args.all) and (args.screenshot or args.all):
+        latest_file = find_latest_il_file()
+
     # Run latest file
     if args.run or args.all:
-        success = run_latest_file(args.quiet, lib=args.lib, cell=args.cell, view=args.view) and success
+        success = run_latest_file(args.quiet, lib=args.lib, cell=args.cell, view=args.view, latest_file=latest_file) and success
 
     # Run latest file and save screenshot
     if args.screenshot or args.all:
-        success = run_latest_file_with_screenshot(args.quiet, lib=args.lib, cell=args.cell, view=args.view) and success
+        success = run_latest_file_with_screenshot(args.quiet, lib=args.lib, cell=args.cell, view=args.view, latest_file=latest_file) and success
 
     if not args.quiet:
         if success:
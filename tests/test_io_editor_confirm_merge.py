@@ -2,11 +2,16 @@
 # -*- coding: utf-8 -*-
 """Regression tests for IO editor confirm merge logic (add/delete/move)."""
 
+import json
+
+import pytest
+
 from src.app.layout import editor_confirm_merge as merge_logic
 
 
-def _base_source_payload():
-    return {
+# Serialized once at import and decoded once per module by the base_source fixture.
+_BASE_SOURCE_JSON = json.dumps(
+    {
         "ring_config": {
             "process_node": "T180",
             "chip_width": 630,
@@ -66,10 +71,22 @@ def _base_source_payload():
             },
         ],
     }
+)
+
+
+def _by_id(items, id_):
+    return next(x for x in items if x.get("id") == id_)
+
+
+@pytest.fixture(scope="module")
+def base_source():
+    # Shared read-only: build_confirmed_payload deep-copies its inputs.
+    # A test that mutates the payload must copy.deepcopy it first.
+    return json.loads(_BASE_SOURCE_JSON)
 
 
-def test_move_instance_updates_position_and_strips_meta():
-    source = _base_source_payload()
+def test_move_instance_updates_position_and_strips_meta(base_source):
+    source = base_source
     editor_payload = {
         "ring_config": {
             "process_node": "T180",
@@ -110,20 +127,21 @@ def test_move_instance_updates_position_and_strips_meta():
     }
 
     merged = merge_logic.build_confirmed_payload(source, editor_payload)
-    merged_by_id = {x["id"]: x for x in merged["instances"]}
+    inst_a = _by_id(merged["instances"], "inst_a")
+    inst_b = _by_id(merged["instances"], "inst_b")
 
-    assert merged_by_id["inst_a"]["position"] == "bottom_1"
-    assert merged_by_id["inst_b"]["position"] == "bottom_0"
-    assert "meta" not in merged_by_id["inst_a"]
-    assert "meta" not in merged_by_id["inst_b"]
-    assert "side" not in merged_by_id["inst_a"]
-    assert "order" not in merged_by_id["inst_a"]
-    assert "_relative_position" not in merged_by_id["inst_a"]
-    assert "position_str" not in merged_by_id["inst_a"]
+    assert inst_a["position"] == "bottom_1"
+    assert inst_b["position"] == "bottom_0"
+    assert "meta" not in inst_a
+    assert "meta" not in inst_b
+    assert "side" not in inst_a
+    assert "order" not in inst_a
+    assert "_relative_position" not in inst_a
+    assert "position_str" not in inst_a
 
 
-def test_add_delete_and_dual_container_sync():
-    source = _base_source_payload()
+def test_add_delete_and_dual_container_sync(base_source):
+    source = base_source
 
     # Remove inst_b, keep inst_a, and add a new analog pad
     editor_payload = {
@@ -156,7 +174,7 @@ def test_add_delete_and_dual_container_sync():
     assert "inst_b" not in ids
     assert "inst_new" in ids
 
-    new_item = next(x for x in merged["instances"] if x.get("id") == "inst_new")
+    new_item = _by_id(merged["instances"], "inst_new")
     assert new_item.get("position") == "right_2"
     assert new_item.get("view_name") == "layout"
     assert new_item.get("pad_width") == 80
@@ -206,8 +224,8 @@ def test_merge_keeps_source_ring_config_shape_only():
     assert merged["ring_config"]["chip_width"] == 720
 
 
-def test_blank_uses_blank_template_with_filler_dimensions():
-    source = _base_source_payload()
+def test_blank_uses_blank_template_with_filler_dimensions(base_source):
+    source = base_source
     editor_payload = {
         "ring_config": source["ring_config"],
         "instances": [
@@ -232,7 +250,7 @@ def test_blank_uses_blank_template_with_filler_dimensions():
     }
 
     merged = merge_logic.build_confirmed_payload(source, editor_payload)
-    blank = next(x for x in merged["instances"] if x.get("id") == "inst_blank")
+    blank = _by_id(merged["instances"], "inst_blank")
 
     assert blank.get("type") == "blank"
     assert blank.get("position") == "bottom_2"
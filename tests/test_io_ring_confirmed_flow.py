@@ -1,19 +1,8 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
-import sys
-import types
 from pathlib import Path
 
-if "smolagents" not in sys.modules:
-    smolagents_stub = types.ModuleType("smolagents")
-
-    def tool(func):
-        return func
-
-    smolagents_stub.tool = tool
-    sys.modules["smolagents"] = smolagents_stub
-
 import src.tools.io_ring_generator_tool as ring_tool
 
 
@@ -11,6 +11,8 @@ import json
 import sys
 from pathlib import Path
 
+import pytest
+
 # Add parent directory to path to import the tool
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -85,7 +87,6 @@ error("Test error with \"quotes\" and\nnewlines and\r\ncarriage returns")
     except Exception as e:
         # If Virtuoso is not available, skip the test
         if "Virtuoso" in str(e) or "connection" in str(e).lower():
-            import pytest
             pytest.skip(f"Virtuoso not available: {e}")
         else:
             print(f"\n❌ FAILED: Exception occurred: {e}")
@@ -100,49 +101,45 @@ error("Test error with \"quotes\" and\nnewlines and\r\ncarriage returns")
             print(f"\n🧹 Cleaned up test file: {test_il_path}")
 
 
-def test_json_escape_with_various_characters():
+# (test name, error message) pairs with characters that are awkward in JSON
+ESCAPE_TEST_CASES = [
+    ('Simple error', 'Error message'),
+    ('Error with quotes', 'Error with "quotes"'),
+    ('Error with newline', 'Error with\nnewline'),
+    ('Error with carriage return', 'Error with\r\ncarriage return'),
+    ('Error with JSON-like string', '{"status": "error", "message": "test"}'),
+    ('Error with mixed characters', 'Error with "quotes"\nand\n{"json": "like"}'),
+    ('Error with control characters', 'Error with\ttab,\bbackspace and \x00 NUL'),
+]
+
+
+@pytest.mark.parametrize("test_name, error_message", ESCAPE_TEST_CASES, ids=[name for name, _ in ESCAPE_TEST_CASES])
+def test_json_escape_with_various_characters(test_name, error_message):
     """Test JSON escape with various problematic characters"""
+    # Simulate what happens in the tool
+    result_dict = {
+        "status": "error",
+        "message": "Test error",
+        "screenshot_path": None,
+        "observations": []
+    }
     
-    print("\n" + "=" * 60)
-    print("Testing JSON escape with various problematic characters")
-    print("=" * 60)
+    # Apply the same escaping logic as in the tool
+    error_details = json.dumps(str(error_message))[1:-1]
+    result_dict["observations"].append(f"Error details: {error_details}")
     
-    test_cases = [
-        ('Simple error', 'Error message'),
-        ('Error with quotes', 'Error with "quotes"'),
-        ('Error with newline', 'Error with\nnewline'),
-        ('Error with carriage return', 'Error with\r\ncarriage return'),
-        ('Error with JSON-like string', '{"status": "error", "message": "test"}'),
-        ('Error with mixed characters', 'Error with "quotes"\nand\n{"json": "like"}'),
-    ]
+    # Try to serialize to JSON
+    json_str = json.dumps(result_dict, ensure_ascii=False)
+    assert isinstance(json_str, str), "json.dumps should return a string"
     
-    for test_name, error_message in test_cases:
-        print(f"\n📝 Test: {test_name}")
-        
-        # Simulate what happens in the tool
-        result_dict = {
-            "status": "error",
-            "message": "Test error",
-            "screenshot_path": None,
-            "observations": []
-        }
-        
-        # Apply the same escaping logic as in the tool
-        error_details = str(error_message).replace('"', '\\"').replace('\n', '\\n').replace('\r', '\\r')
-        result_dict["observations"].append(f"Error details: {error_details}")
-        
-        # Try to serialize to JSON
-        json_str = json.dumps(result_dict, ensure_ascii=False)
-        assert isinstance(json_str, str), "json.dumps should return a string"
-        
-        # Try to parse back
-        parsed = json.loads(json_str)
-        assert isinstance(parsed, dict), "json.loads should return a dictionary"
-        
-        # Verify the error details are preserved
-        obs = parsed["observations"][0]
-        assert "Error details:" in obs, "Error details should be preserved in observations"
-        print(f"   ✅ PASSED: JSON serialization/parsing successful")
+    # Try to parse back
+    parsed = json.loads(json_str)
+    assert isinstance(parsed, dict), "json.loads should return a dictionary"
+    
+    # Verify the error details are preserved
+    obs = parsed["observations"][0]
+    assert "Error details:" in obs, f"{test_name}: error details should be preserved in observations"
+    assert json.loads(f'"{error_details}"') == error_message, f"{test_name}: escaped details should decode to the original message"
 
 
 if __name__ == "__main__":
@@ -156,7 +153,9 @@ if __name__ == "__main__":
         print(f"\n⚠️  Test 1 skipped (Virtuoso not available): {e}")
     
     # Test 2: Test with various characters (no Virtuoso needed)
-    test_json_escape_with_various_characters()
+    for test_name, error_message in ESCAPE_TEST_CASES:
+        test_json_escape_with_various_characters(test_name, error_message)
+        print(f"   ✅ PASSED: {test_name}")
     
     # Summary
     print("\n" + "=" * 60)
@@ -9,56 +9,28 @@ import sys
 project_root = Path(__file__).parent.parent
 sys.path.append(str(project_root))
 
-from src.app.utils.custom_logger import MinimalOutputLogger
-
-def test_logger_thought():
-    """Test logging thought messages"""
-    logger = MinimalOutputLogger()
-    print("Test 1: Thought (should be CYAN)")
-    logger.log("Thought: The user is testing the logger functionality...")
-    # Logger should not raise exceptions
-    assert True
-
-def test_logger_final_answer():
-    """Test logging final answer"""
-    logger = MinimalOutputLogger()
-    print("\nTest 2: Final answer (should be GREEN)")
-    logger.log("Final answer: The logger is working correctly with colors!")
-    assert True
-
-def test_logger_step_timing():
-    """Test logging step timing"""
-    logger = MinimalOutputLogger()
-    print("\nTest 3: Step timing (should be YELLOW)")
-    logger.log("[Step 1: Duration 5.23 seconds | Input tokens: 1,234 | Output tokens: 567]")
-    assert True
+import pytest
 
-def test_logger_observation():
-    """Test logging observations"""
-    logger = MinimalOutputLogger()
-    print("\nTest 4: Observation (should be default color)")
-    logger.log("Observation: Test completed successfully")
-    assert True
-
-def test_logger_code_execution():
-    """Test logging code execution"""
-    logger = MinimalOutputLogger()
-    print("\nTest 5: Code execution (should be HIDDEN)")
-    logger.log("─ Executing parsed code:")
-    assert True
-
-if __name__ == "__main__":
-    print("\n" + "=" * 70)
-    print("Testing MinimalOutputLogger")
-    print("=" * 70 + "\n")
-    
-    test_logger_thought()
-    test_logger_final_answer()
-    test_logger_step_timing()
-    test_logger_observation()
-    test_logger_code_execution()
-    
-    print("\n" + "=" * 70)
-    print("Test Complete")
-    print("=" * 70 + "\n")
+from src.app.utils.custom_logger import MinimalOutputLogger
 
+C = MinimalOutputLogger
+
+# (message, expected stdout) - colored, plain, or hidden entirely
+LOG_CASES = [
+    ("Thought: The user is testing the logger functionality...",
+     f"{C.CYAN}Thought: The user is testing the logger functionality...{C.RESET}\n"),
+    ("Final answer: The logger is working correctly with colors!",
+     f"{C.GREEN}Final answer: The logger is working correctly with colors!{C.RESET}\n"),
+    ("[Step 1: Duration 5.23 seconds | Input tokens: 1,234 | Output tokens: 567]",
+     f"{C.YELLOW}[Step 1: Duration 5.23 seconds | Input tokens: 1,234 | Output tokens: 567]{C.RESET}\n"),
+    ("Observation: Test completed successfully",
+     "Observation: Test completed successfully\n"),
+    ("─ Executing parsed code:", ""),
+]
+
+
+@pytest.mark.parametrize("message, expected", LOG_CASES)
+def test_logger_output(capsys, message, expected):
+    """Test that each message kind is colored, left plain, or hidden"""
+    MinimalOutputLogger().log(message)
+    assert capsys.readouterr().out == expected
@@ -15,6 +15,7 @@ from src.tools.python_tool_creator import (
     create_python_helper,
     list_python_helpers,
     view_python_helper_code,
+    update_python_helper,
     delete_python_helper
 )
 
@@ -50,13 +51,18 @@ def test_create_parse_il_comments():
     result = create_python_helper(
         tool_name="parse_il_comments",
         description="Extract all comments from IL file content",
-        function_body='''
+        module_preamble='''
 import re
+
+# ;; style comments, compiled once when the helper module loads
+_CMT = re.compile(r';;(.*)$', re.MULTILINE)
+''',
+        function_body='''
 with open(file_path, 'r', encoding='utf-8') as f:
     content = f.read()
 
 # Find all ;; style comments
-comments = re.findall(r';;(.*)$', content, re.MULTILINE)
+comments = _CMT.findall(content)
 return '\\n'.join(comment.strip() for comment in comments)
 ''',
         parameters='{"file_path": "str"}',
@@ -90,6 +96,40 @@ def test_view_helper_code():
     print(result)
 
 
+def test_update_helper_with_preamble_def():
+    """Test updating a helper whose module preamble defines a function"""
+    print("\n" + "="*80)
+    print("Test 5: Update helper with a def in its preamble")
+    print("="*80)
+
+    tool_name = "preamble_def_helper"
+    create_python_helper(
+        tool_name=tool_name,
+        description="Return a value computed by a preamble function",
+        module_preamble='''
+def _h(x) -> int:
+    """helper"""
+    return x
+''',
+        function_body='return {"v": _h(1)}',
+        parameters='{}',
+        return_type="dict"
+    )
+
+    try:
+        result = update_python_helper(tool_name, 'return {"v": _h(2)}')
+        assert "updated successfully" in result, result
+
+        code = view_python_helper_code(tool_name)
+        assert "def _h(x) -> int:" in code, "Preamble function should be kept"
+        assert f"@tool\ndef {tool_name}() -> dict:" in code, "@tool function should be kept"
+        assert 'return {"v": _h(2)}' in code, "@tool body should be replaced"
+        assert 'return {"v": _h(1)}' not in code, "Old @tool body should be gone"
+        print(result)
+    finally:
+        delete_python_helper(tool_name)
+
+
 def test_cleanup():
     """Clean up test-created helpers"""
     print("\n" + "="*80)
@@ -115,7 +155,10 @@ if __name__ == "__main__":
         
         # View code
         test_view_helper_code()
-        
+
+        # Update with a preamble def
+        test_update_helper_with_preamble_def()
+
         # Cleanup
         test_cleanup()
         
@@ -11,12 +11,19 @@ Options:
     -i, --interactive  Interactive selection of files to run
     -n NUMBER          Run file with specified number
     -l, --list         Only list found files, do not execute
+    -j, --jobs N       With --all, run up to N Python code files concurrently.
+                       Only safe when the code files write different .il paths:
+                       a file run ahead can overwrite a shared output before an
+                       earlier file's skill run has loaded it
 """
 
 import os
 import re
 import sys
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 # Add project root directory to Python path
@@ -24,6 +31,31 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.tools.il_runner_tool import clear_all_figures_in_window  # New import
 
+# Skill file names announced in Python output: a known prefix followed by the
+# path, or any bare *.il name. One compiled alternation scans the whole output.
+SKILL_FILE_RE = re.compile(
+    r'(?:Skill script generated|Generated skill file|Created skill script|Skill file created'
+    r'|Saved as|Output file|File saved)[:：][^\S\n]*([^\s]+\.il)'
+    r'|([a-zA-Z_][a-zA-Z0-9_/]*\.il)',
+    re.IGNORECASE,
+)
+
+def _walk_code_files(root, pattern):
+    """Recursively yield (file path, modification time) for files below root matching pattern"""
+    try:
+        entries = os.scandir(root)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            # Hidden entries are skipped, as glob does
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_code_files(entry.path, pattern)
+            elif fnmatch(entry.name, pattern):
+                yield entry.path, entry.stat().st_mtime
+
 def get_all_code_files(output_dir, pattern=None):
     """Recursively get all code files, sorted by timestamp
     
@@ -34,22 +66,9 @@ def get_all_code_files(output_dir, pattern=None):
     Returns:
         List containing (file path, modification time) tuples, sorted by timestamp
     """
-    if pattern is None:
-        patterns = ["*.py"]
-    else:
-        patterns = [pattern]
-    
-    all_files = []
-    import glob
-    for pattern in patterns:
-        # Recursively find all subdirectories
-        full_pattern = str(output_dir / "**" / pattern)
-        code_files = glob.glob(full_pattern, recursive=True)
-        for file in code_files:
-            mtime = os.path.getmtime(file)
-            all_files.append((file, mtime))
+    all_files = list(_walk_code_files(output_dir, pattern or "*.py"))
     # Sort by modification time
-    all_files.sort(key=lambda x: x[1])
+    all_files.sort(key=itemgetter(1))
     return all_files
 
 def test_get_all_code_files():
@@ -72,46 +91,26 @@ def get_latest_code_file(output_dir, pattern=None):
 def extract_skill_files(output_text, output_dir=None):
     """Extract generated skill script names from Python code output, return unique path relative to output"""
     skill_files = []
-    lines = output_text.split('\n')
-    
-    patterns = [
-        r'Skill script generated[:：]\s*([^\s]+\.il)',
-        r'Generated skill file[:：]\s*([^\s]+\.il)', 
-        r'Created skill script[:：]\s*([^\s]+\.il)',
-        r'Skill file created[:：]\s*([^\s]+\.il)',
-        r'Generated skill file[:：]\s*([^\s]+\.il)',
-        r'Created skill script[:：]\s*([^\s]+\.il)',
-        r'Saved as[:：]\s*([^\s]+\.il)',
-        r'Output file[:：]\s*([^\s]+\.il)',
-        r'File saved[:：]\s*([^\s]+\.il)',
-        r'([a-zA-Z_][a-zA-Z0-9_/]*\.il)',
-    ]
-    
     seen = set()
-    for line in lines:
-        line = line.strip()
-        for pattern in patterns:
-            import re
-            matches = re.findall(pattern, line, re.IGNORECASE)
-            for match in matches:
-                match_path = Path(match)
-                # Pseudo absolute path correction
-                if not match_path.is_absolute() and str(match_path).startswith("home/"):
-                    match_path = Path("/" + str(match_path))
-                if output_dir is not None:
-                    try:
-                        match_path = match_path.resolve()
-                        output_dir_resolved = output_dir.resolve()
-                        if str(match_path).startswith(str(output_dir_resolved)):
-                            match_path = match_path.relative_to(output_dir_resolved)
-                        else:
-                            # Skip files not under output_dir
-                            continue
-                    except Exception:
-                        continue
-                if str(match_path) not in seen:
-                    seen.add(str(match_path))
-                    skill_files.append(str(match_path))
+    # Resolve output_dir once; each match only needs its own realpath
+    if output_dir is not None:
+        output_dir_prefix = os.path.join(os.path.realpath(output_dir), '')
+    for m in SKILL_FILE_RE.finditer(output_text):
+        match = m.group(1) or m.group(2)
+        # Pseudo absolute path correction
+        if not os.path.isabs(match) and match.startswith("home/"):
+            match = "/" + match
+        if output_dir is not None:
+            match_real = os.path.realpath(match)
+            if not match_real.startswith(output_dir_prefix):
+                # Skip files not under output_dir
+                continue
+            match = match_real[len(output_dir_prefix):]
+        else:
+            match = str(Path(match))
+        if match not in seen:
+            seen.add(match)
+            skill_files.append(match)
     return skill_files
 
 def test_extract_skill_files():
@@ -127,6 +126,7 @@ def test_extract_skill_files():
 def execute_python_code(code_file, project_root):
     """Execute Python code file"""
     import subprocess
+    import tempfile
     
     try:
         # Add project root directory to Python path
@@ -134,25 +134,30 @@ def execute_python_code(code_file, project_root):
         python_path = env.get('PYTHONPATH', '')
         env['PYTHONPATH'] = f"{project_root}:{python_path}"
         
-        # Execute Python file
-        result = subprocess.run(
-            [sys.executable, code_file],
-            cwd=project_root,
-            capture_output=True,
-            text=True,
-            encoding='utf-8',
-            errors='replace',
-            timeout=60,
-            env=env
-        )
-        
-        if result.returncode != 0:
-            error_msg = f"Exit code: {result.returncode}\n"
-            if result.stdout:
-                error_msg += f"Standard output:\n{result.stdout}\n"
-            if result.stderr:
-                error_msg += f"Error output:\n{result.stderr}"
-            return False, error_msg
+        # Execute Python file; stderr goes to a temporary file and is only
+        # read back and decoded when the script fails
+        with tempfile.TemporaryFile() as stderr_file:
+            result = subprocess.run(
+                [sys.executable, code_file],
+                cwd=project_root,
+                stdout=subprocess.PIPE,
+                stderr=stderr_file,
+                text=True,
+                encoding='utf-8',
+                errors='replace',
+                timeout=60,
+                env=env
+            )
+            
+            if result.returncode != 0:
+                stderr_file.seek(0)
+                stderr = stderr_file.read().decode('utf-8', errors='replace')
+                error_msg = f"Exit code: {result.returncode}\n"
+                if result.stdout:
+                    error_msg += f"Standard output:\n{result.stdout}\n"
+                if stderr:
+                    error_msg += f"Error output:\n{stderr}"
+                return False, error_msg
             
         return True, result.stdout
         
@@ -161,8 +166,30 @@ def execute_python_code(code_file, project_root):
     except Exception as e:
         return False, f"Execution exception: {str(e)}"
 
-def execute_skill_file(skill_file, project_root):
-    """Execute a single skill file"""
+def _load_skill_file(ws, skill_file):
+    """Load a skill file into an open workspace and save the edited cellview"""
+    try:
+        ws['load'](str(skill_file))
+        cv = ws['geGetEditCellView']()
+        ws['dbSave'](cv)
+        return True
+    except Exception as e:
+        import traceback
+        print(f"Failed to execute skill file: {e}")
+        traceback.print_exc()
+        return False
+
+def execute_skill_file(skill_file, project_root, ws=None):
+    """Execute a single skill file
+    
+    Args:
+        skill_file: Skill file path
+        project_root: Project root directory
+        ws: Open skillbridge workspace to reuse; when omitted a private one
+            is opened and closed around this file
+    """
+    if ws is not None:
+        return _load_skill_file(ws, skill_file)
     try:
         # Import skillbridge
         from skillbridge import Workspace
@@ -170,15 +197,7 @@ def execute_skill_file(skill_file, project_root):
         # Open workspace and execute skill script
         ws = Workspace.open()
         try:
-            ws['load'](str(skill_file))
-            cv = ws['geGetEditCellView']()
-            ws['dbSave'](cv)
-            return True
-        except Exception as e:
-            import traceback
-            print(f"Failed to execute skill file: {e}")
-            traceback.print_exc()
-            return False
+            return _load_skill_file(ws, skill_file)
         finally:
             ws.close()
             
@@ -220,15 +239,24 @@ def interactive_select(files):
 
 # Modify run_single_file to call extract_skill_files and avoid executing the same physical file repeatedly
 
-def run_single_file(code_file, project_root):
-    """Run the complete process for a single file, avoiding repeated execution of the same Skill file"""
+def run_single_file(code_file, project_root, python_result=None):
+    """Run the complete process for a single file, avoiding repeated execution of the same Skill file
+    
+    Args:
+        code_file: Python code file path
+        project_root: Project root directory
+        python_result: (success, output) of execute_python_code when the code
+            file was already run ahead (see --jobs); it is run here otherwise
+    """
     if not code_file:
         print("❌ No code file found")
         return False
     print(f"Running code file: {code_file}")
     
     # Execute Python code
-    success, output = execute_python_code(code_file, project_root)
+    if python_result is None:
+        python_result = execute_python_code(code_file, project_root)
+    success, output = python_result
     if not success:
         print(f"❌ Python code execution failed:\n{output}")
         return False
@@ -246,25 +274,44 @@ def run_single_file(code_file, project_root):
     executed_files = set()
     success_count = 0
     from pathlib import Path
-    for skill_file in skill_files:
-        # Clear window before each execution
-        clear_result = clear_all_figures_in_window()
-        print(f"Window clearing result: {clear_result}")
-        skill_path = Path(skill_file)
-        if not skill_path.is_absolute():
-            skill_path = output_dir / skill_path
-        if not skill_path.exists():
-            skill_path = output_dir / Path(skill_file).name
-        real_path = skill_path.resolve()
-        print(f"Preparing to execute skill file: {skill_path} (exists: {skill_path.exists()})")  # Debug info
-        if not skill_path.exists() or real_path in executed_files:
-            continue
-        if execute_skill_file(skill_path, project_root):
-            success_count += 1
-            executed_files.add(real_path)
-            print(f"✅ Successfully executed: {skill_file}")
-        else:
-            print(f"❌ Execution failed: {skill_file}")
+    
+    # One workspace serves every skill file; without skillbridge each file
+    # falls back to the existence check in execute_skill_file
+    try:
+        from skillbridge import Workspace
+        ws = Workspace.open()
+    except ImportError:
+        ws = None
+    except Exception as e:
+        import traceback
+        print(f"An error occurred while opening skillbridge workspace: {e}")
+        traceback.print_exc()
+        print("❌ All skill scripts failed to execute")
+        return False
+    
+    try:
+        for skill_file in skill_files:
+            # Clear window before each execution
+            clear_result = clear_all_figures_in_window()
+            print(f"Window clearing result: {clear_result}")
+            skill_path = Path(skill_file)
+            if not skill_path.is_absolute():
+                skill_path = output_dir / skill_path
+            if not skill_path.exists():
+                skill_path = output_dir / Path(skill_file).name
+            real_path = skill_path.resolve()
+            print(f"Preparing to execute skill file: {skill_path} (exists: {skill_path.exists()})")  # Debug info
+            if not skill_path.exists() or real_path in executed_files:
+                continue
+            if execute_skill_file(skill_path, project_root, ws):
+                success_count += 1
+                executed_files.add(real_path)
+                print(f"✅ Successfully executed: {skill_file}")
+            else:
+                print(f"❌ Execution failed: {skill_file}")
+    finally:
+        if ws is not None:
+            ws.close()
     
     if success_count == 0:
         print("❌ All skill scripts failed to execute")
@@ -281,8 +328,14 @@ def main():
     parser.add_argument('-n', type=int, help='Run file with specified number')
     parser.add_argument('-l', '--list', action='store_true', help='Only list found files, do not execute')
     parser.add_argument('-t', '--latest', action='store_true', help='Only run the latest Python code file')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='With --all, run up to N Python code files concurrently; skill files still execute one at a time. '
+                             'Only use when the code files write different .il paths, since a file run ahead can overwrite '
+                             'a shared output before an earlier file\'s skills are loaded (default: 1)')
     
     args = parser.parse_args()
+    if args.jobs < 1:
+        parser.error("--jobs must be at least 1")
     
     # Set paths
     project_root = Path(__file__).parent.parent
@@ -318,9 +371,21 @@ def main():
     # Run all files
     if args.all:
         print(f"Preparing to run all {len(all_files)} files...")
-        for i, (file, _) in enumerate(all_files, 1):
-            print(f"\nRunning file {i}/{len(all_files)}:")
-            run_single_file(file, project_root)
+        if args.jobs == 1:
+            for i, (file, _) in enumerate(all_files, 1):
+                print(f"\nRunning file {i}/{len(all_files)}:")
+                run_single_file(file, project_root)
+            return
+        
+        # Python code files run ahead in the pool; their skill files are
+        # executed here, in file order, against one Virtuoso session at a time.
+        # Nothing isolates their outputs, so files writing the same .il path
+        # must not be combined with --jobs
+        with ThreadPoolExecutor(max_workers=args.jobs) as executor:
+            futures = [executor.submit(execute_python_code, file, project_root) for file, _ in all_files]
+            for i, ((file, _), future) in enumerate(zip(all_files, futures), 1):
+                print(f"\nRunning file {i}/{len(all_files)}:")
+                run_single_file(file, project_root, python_result=future.result())
         return
     
     # Run the latest file (new -t/--latest parameter)
@@ -339,5 +404,30 @@ def main():
         print("Running the latest file:")
         run_single_file(latest_file, project_root)
 
+def test_all_jobs_runs_skill_files_in_file_order(monkeypatch):
+    """Test --all --jobs: code files run ahead, results are handed off in file order"""
+    import time
+    module = sys.modules[__name__]
+    files = [(f"gen_{i}.py", i) for i in range(4)]
+    # Earlier files finish last, so completion order differs from file order
+    delays = {file: 0.05 * (len(files) - i) for i, (file, _) in enumerate(files)}
+    monkeypatch.setattr(module, "get_all_code_files", lambda output_dir: files)
+    
+    def fake_execute_python_code(code_file, project_root):
+        time.sleep(delays[code_file])
+        return True, f"Saved as: output/{code_file}.il"
+    
+    calls = []
+    monkeypatch.setattr(module, "execute_python_code", fake_execute_python_code)
+    monkeypatch.setattr(module, "run_single_file",
+                        lambda code_file, project_root, python_result=None: calls.append((code_file, python_result)))
+    monkeypatch.setattr(sys, "argv", ["test_quick_flow.py", "--all", "--jobs", "4"])
+    
+    main()
+    
+    assert [code_file for code_file, _ in calls] == [file for file, _ in files]
+    for code_file, python_result in calls:
+        assert python_result == (True, f"Saved as: output/{code_file}.il")
+
 if __name__ == '__main__':
     main()
\ No newline at end of file
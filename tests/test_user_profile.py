@@ -7,7 +7,8 @@ import os
 from pathlib import Path
 
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
 
 from src.tools.user_profile_tool import update_user_profile, read_profile
 